@@ -0,0 +1,61 @@
+#   Copyright 2022-2022 Exactpro (Exactpro Systems Limited)
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+from typing import Any, Dict, NamedTuple
+
+
+class MessageShape(NamedTuple):
+    """Shape of a synthetic message.
+
+    Attributes:
+        width: Number of simple fields on every nesting level.
+        depth: Number of nested levels below the top one.
+        list_size: Number of elements of the repeating group on every nested level.
+    """
+
+    width: int
+    depth: int
+    list_size: int
+
+
+SHAPES: Dict[str, MessageShape] = {
+    'small': MessageShape(width=10, depth=1, list_size=2),
+    'wide': MessageShape(width=500, depth=0, list_size=0),
+    'deep': MessageShape(width=3, depth=8, list_size=0),
+    'lists': MessageShape(width=5, depth=2, list_size=50),
+}
+
+
+def generate_fields(shape: MessageShape, seed: int = 0) -> Dict[str, Any]:
+    """Generates message fields of the given shape.
+
+    Every level contains 'width' simple fields named 'Field0', 'Field1', ..., a sub-message 'Group' and
+    a repeating group 'Entries' with 'list_size' elements (the last two only if 'depth' > 0).
+    """
+
+    fields: Dict[str, Any] = {f'Field{index}': str(seed + index) for index in range(shape.width)}
+
+    if shape.depth > 0:
+        nested_shape = shape._replace(depth=shape.depth - 1)
+        fields['Group'] = generate_fields(nested_shape, seed + 1)
+        if shape.list_size > 0:
+            fields['Entries'] = [generate_fields(nested_shape, seed + index) for index in range(shape.list_size)]
+
+    return fields
+
+
+def deepest_field_path(shape: MessageShape) -> str:
+    """Returns the path of a simple field on the deepest level of a message generated by `generate_fields`."""
+
+    return '.'.join(['Group'] * shape.depth + ['Field0'])
@@ -0,0 +1,69 @@
+#   Copyright 2022-2022 Exactpro (Exactpro Systems Limited)
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""Import time benchmark of th2-common-utils.
+
+Every scenario is run in a fresh interpreter, the median wall time of '--repeat' runs is reported.
+
+Usage:
+    python -m benchmarks.import_time
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+SCENARIOS: Dict[str, str] = {
+    'python': 'pass',
+    'import th2_common_utils': 'import th2_common_utils',
+    'message_to_dict': 'from th2_common_utils import message_to_dict',
+    'create_event': 'from th2_common_utils import create_event',
+    'all exports': 'from th2_common_utils import *',
+    'all exports + fields access': 'from th2_common_utils import *; enable_message_fields_access()',
+}
+
+_TIMER = '''
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+'''
+
+
+def measure_import_time(statement: str, repeat: int) -> float:
+    """Returns the median time of the statement in seconds, each run is done in a new interpreter."""
+
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', _TIMER.format(statement=statement)],
+                                check=True, capture_output=True, text=True).stdout
+        timings.append(float(output))
+    return statistics.median(timings)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Measure th2-common-utils import time.')
+    parser.add_argument('--repeat', type=int, default=10, help='Number of interpreter runs per scenario.')
+    args = parser.parse_args(argv)
+
+    sys.stdout.write(f"{'scenario':<30} {'ms':>8}\n")
+    for name, statement in SCENARIOS.items():
+        sys.stdout.write(f'{name:<30} {measure_import_time(statement, args.repeat) * 1000:>8.2f}\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
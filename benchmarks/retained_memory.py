@@ -0,0 +1,82 @@
+#   Copyright 2022-2022 Exactpro (Exactpro Systems Limited)
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""Memory retained by converted messages kept in memory.
+
+Usage:
+    python -m benchmarks.retained_memory
+"""
+
+import argparse
+import datetime
+import gc
+import sys
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.generators import generate_fields, MessageShape, SHAPES
+
+from th2_common_utils import dict_to_message, message_to_compact_dict, message_to_dict
+
+
+CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    'message_to_dict': message_to_dict,
+    'message_to_compact_dict': message_to_compact_dict,
+    'message_to_compact_dict(intern_values)': lambda message: message_to_compact_dict(message, intern_values=True)
+}
+
+
+def measure_retained_memory(converter: Callable[[Any], Any], messages: List[Any]) -> float:
+    """Returns the average number of bytes allocated by Python and retained per converted message."""
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        converted = [converter(message) for message in messages]
+        retained = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del converted
+    return retained / len(messages)
+
+
+def generate_message(shape: MessageShape, index: int) -> Any:
+    """Returns a message of the given shape with its own metadata."""
+
+    return dict_to_message(
+        generate_fields(shape, seed=index % 3),
+        message_type='NewOrderSingle',
+        session_alias='session',
+        sequence=index,
+        timestamp=datetime.datetime.now()
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Measure memory retained by converted messages.')
+    parser.add_argument('--count', type=int, default=200, help='Number of messages per shape.')
+    args = parser.parse_args(argv)
+
+    sys.stdout.write(f"{'shape':<8} {'protobuf B':>11} " + ' '.join(f'{name:>40}' for name in CONVERTERS) + '\n')
+    for shape_name, shape in SHAPES.items():
+        # Messages of a stream share field names and metadata strings but not the objects holding them.
+        messages = [generate_message(shape, index) for index in range(args.count)]
+        protobuf_size = sum(message.ByteSize() for message in messages) / len(messages)
+        sizes = ' '.join(f'{measure_retained_memory(converter, messages):>40.0f}' for converter in CONVERTERS.values())
+        sys.stdout.write(f'{shape_name:<8} {protobuf_size:>11.0f} {sizes}\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,351 @@
+#   Copyright 2022-2022 Exactpro (Exactpro Systems Limited)
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""Benchmark suite of th2-common-utils.
+
+Usage:
+    python -m benchmarks.run                           # run and compare with benchmarks/baseline.json
+    python -m benchmarks.run --save-baseline           # run and overwrite the baseline
+    python -m benchmarks.run -k message_to_dict -s deep
+
+Exit code is 1 if some benchmark is slower (or uses more memory) than the baseline by more than the tolerance.
+"""
+
+import argparse
+import gc
+import json
+from pathlib import Path
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.generators import deepest_field_path, generate_fields, MessageShape, SHAPES
+import orjson
+from th2_grpc_common.common_pb2 import Message
+
+from th2_common_utils import columns_to_messages, create_event, decode_message, dict_to_message, \
+    dict_to_root_message_filter, dicts_to_root_message_filters, message_to_dict, message_to_json_bytes, \
+    message_to_table, MessageFactory, messages_to_comparison_table, MessageTemplate
+from th2_common_utils.field_path import compile_field_path
+from th2_common_utils.instrumentation import disable_instrumentation, enable_instrumentation, reset_metrics
+from th2_common_utils.message_fields_access import message_getitem
+
+
+Benchmark = Callable[[MessageShape], Callable[[], Any]]
+
+BASELINE_PATH = Path(__file__).with_name('baseline.json')
+BENCHMARKS: Dict[str, Benchmark] = {}
+# Peak memory of small cases is a few hundred bytes, so tiny absolute changes are not reported as regressions.
+MEMORY_SLACK_KIB = 1.0
+
+
+def benchmark(name: str) -> Callable[[Benchmark], Benchmark]:
+    """Registers a benchmark. The decorated function prepares the data and returns the measured callable."""
+
+    def register(setup: Benchmark) -> Benchmark:
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+@benchmark('message_to_dict')
+def _message_to_dict(shape: MessageShape) -> Callable[[], Any]:
+    message = dict_to_message(generate_fields(shape), message_type='Benchmark')
+    return lambda: message_to_dict(message)
+
+
+@benchmark('message_to_json_bytes')
+def _message_to_json_bytes(shape: MessageShape) -> Callable[[], Any]:
+    message = dict_to_message(generate_fields(shape), message_type='Benchmark')
+    return lambda: message_to_json_bytes(message)
+
+
+@benchmark('message_to_dict+orjson')
+def _message_to_dict_orjson(shape: MessageShape) -> Callable[[], Any]:
+    message = dict_to_message(generate_fields(shape), message_type='Benchmark')
+    return lambda: orjson.dumps(message_to_dict(message))
+
+
+@benchmark('decode_message')
+def _decode_message(shape: MessageShape) -> Callable[[], Any]:
+    data = dict_to_message(generate_fields(shape), message_type='Benchmark').SerializeToString()
+    return lambda: decode_message(data)
+
+
+@benchmark('decode_message(skip)')
+def _decode_message_skip(shape: MessageShape) -> Callable[[], Any]:
+    data = dict_to_message(generate_fields(shape), message_type='Benchmark').SerializeToString()
+    return lambda: decode_message(data, skip_fields={'Group', 'Entries'})
+
+
+@benchmark('ParseFromString+message_to_dict')
+def _parse_message_to_dict(shape: MessageShape) -> Callable[[], Any]:
+    data = dict_to_message(generate_fields(shape), message_type='Benchmark').SerializeToString()
+
+    def parse_and_convert() -> Any:
+        message = Message()
+        message.ParseFromString(data)
+        return message_to_dict(message)
+
+    return parse_and_convert
+
+
+@benchmark('columns_to_messages')
+def _columns_to_messages(shape: MessageShape) -> Callable[[], Any]:
+    rows = [generate_fields(shape._replace(depth=0), seed) for seed in range(100)]
+    columns = {column: [row[column] for row in rows] for column in rows[0]}
+    return lambda: columns_to_messages(columns)
+
+
+@benchmark('dict_to_message(rows)')
+def _dict_to_message_rows(shape: MessageShape) -> Callable[[], Any]:
+    rows = [generate_fields(shape._replace(depth=0), seed) for seed in range(100)]
+    return lambda: [dict_to_message(row, sequence=sequence) for sequence, row in enumerate(rows, 1)]
+
+
+@benchmark('dict_to_message')
+def _dict_to_message(shape: MessageShape) -> Callable[[], Any]:
+    fields = generate_fields(shape)
+    return lambda: dict_to_message(fields, message_type='Benchmark')
+
+
+def _with_instrumentation(function: Callable[[], Any], measure_sizes: bool) -> Callable[[], Any]:
+    """Returns the function calling 'function' with instrumentation enabled (it's disabled between calls)."""
+
+    def call_instrumented() -> Any:
+        enable_instrumentation(measure_sizes)
+        try:
+            return function()
+        finally:
+            disable_instrumentation()
+            reset_metrics()
+
+    return call_instrumented
+
+
+@benchmark('dict_to_message(instrumented)')
+def _dict_to_message_instrumented(shape: MessageShape) -> Callable[[], Any]:
+    return _with_instrumentation(_dict_to_message(shape), measure_sizes=False)
+
+
+@benchmark('dict_to_message(instrumented, sizes)')
+def _dict_to_message_instrumented_sizes(shape: MessageShape) -> Callable[[], Any]:
+    return _with_instrumentation(_dict_to_message(shape), measure_sizes=True)
+
+
+@benchmark('message_to_dict(instrumented)')
+def _message_to_dict_instrumented(shape: MessageShape) -> Callable[[], Any]:
+    return _with_instrumentation(_message_to_dict(shape), measure_sizes=False)
+
+
+@benchmark('message_to_table')
+def _message_to_table(shape: MessageShape) -> Callable[[], Any]:
+    message = dict_to_message(generate_fields(shape))
+    return lambda: message_to_table(message)
+
+
+@benchmark('dict_to_root_message_filter')
+def _dict_to_root_message_filter(shape: MessageShape) -> Callable[[], Any]:
+    fields = generate_fields(shape)
+    return lambda: dict_to_root_message_filter(message_type='Benchmark', message_filter=fields)
+
+
+@benchmark('dicts_to_root_message_filters')
+def _dicts_to_root_message_filters(shape: MessageShape) -> Callable[[], Any]:
+    # Filters of one scenario differ in a few top-level fields and share the nested blocks.
+    fields = generate_fields(shape)
+    filters = [
+        {'message_type': 'Benchmark', 'message_filter': dict(fields, ClOrdID=str(index))} for index in range(20)
+    ]
+    return lambda: dicts_to_root_message_filters(filters)
+
+
+@benchmark('messages_to_comparison_table')
+def _messages_to_comparison_table(shape: MessageShape) -> Callable[[], Any]:
+    messages = [dict_to_message(generate_fields(shape, seed)) for seed in range(4)]
+    return lambda: bytes(messages_to_comparison_table(messages))
+
+
+@benchmark('MessageFactory.message')
+def _message_factory_message(shape: MessageShape) -> Callable[[], Any]:
+    fields = generate_fields(shape)
+    factory = MessageFactory(session_alias='session', book_name='book', protocol='FIX')
+    return lambda: factory.message(fields, message_type='NewOrderSingle')
+
+
+@benchmark('MessageTemplate.variant_bytes')
+def _message_template_variant_bytes(shape: MessageShape) -> Callable[[], Any]:
+    template = MessageTemplate(dict_to_message(generate_fields(shape)))
+    return lambda: template.variant_bytes({'ClOrdID': 'order-1', 'Price': 10.5})
+
+
+@benchmark('CopyFrom+set+serialize')
+def _copy_from_set_serialize(shape: MessageShape) -> Callable[[], Any]:
+    base = dict_to_message(generate_fields(shape))
+
+    def copy_and_set() -> Any:
+        message = Message()
+        message.CopyFrom(base)
+        message.fields['ClOrdID'].simple_value = 'order-1'
+        message.fields['Price'].simple_value = '10.5'
+        return message.SerializeToString()
+
+    return copy_and_set
+
+
+@benchmark('create_event_body')
+def _create_event_body(shape: MessageShape) -> Callable[[], Any]:
+    table = message_to_table(dict_to_message(generate_fields(shape)))
+    return lambda: create_event(book_name='book', scope='scope', body=table)
+
+
+@benchmark('message_getitem')
+def _message_getitem(shape: MessageShape) -> Callable[[], Any]:
+    message = dict_to_message(generate_fields(shape))
+    steps = compile_field_path(deepest_field_path(shape)).steps
+
+    def get_field_chain() -> Any:
+        value = message
+        for step in steps:
+            value = message_getitem(value, step)  # type: ignore
+        return value
+
+    return get_field_chain
+
+
+@benchmark('field_path_get')
+def _field_path_get(shape: MessageShape) -> Callable[[], Any]:
+    messages = [dict_to_message(generate_fields(shape))] * 100
+    field_path = compile_field_path(deepest_field_path(shape))
+    return lambda: field_path.get_many(messages)
+
+
+def measure_throughput(function: Callable[[], Any], min_time: float, repeat: int) -> float:
+    """Returns the best number of calls per second among 'repeat' runs lasting at least 'min_time' seconds."""
+
+    number = 1
+    while True:
+        elapsed = _time_calls(function, number)
+        if elapsed >= min_time / 10:
+            break
+        number *= 10
+    number = max(int(number * min_time / elapsed), 1)
+
+    return max(number / _time_calls(function, number) for _ in range(repeat))
+
+
+def _time_calls(function: Callable[[], Any], number: int) -> float:
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        return time.perf_counter() - start
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def measure_peak_memory(function: Callable[[], Any]) -> int:
+    """Returns peak memory in bytes allocated by Python during a single call."""
+
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(names: List[str], shapes: List[str], min_time: float, repeat: int) -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {}
+    for name in names:
+        for shape_name in shapes:
+            function = BENCHMARKS[name](SHAPES[shape_name])
+            results[f'{name}[{shape_name}]'] = {
+                'ops_per_sec': measure_throughput(function, min_time, repeat),
+                'peak_memory_kib': measure_peak_memory(function) / 1024
+            }
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]],
+            baseline: Dict[str, Dict[str, float]],
+            tolerance: float) -> List[str]:
+    """Returns descriptions of the benchmarks that regressed compared to the baseline."""
+
+    regressions = []
+    for case, result in results.items():
+        baseline_result = baseline.get(case)
+        if baseline_result is None:
+            continue
+        if result['ops_per_sec'] < baseline_result['ops_per_sec'] * (1 - tolerance):
+            regressions.append(f"{case}: {result['ops_per_sec']:.1f} ops/s "
+                               f"(baseline {baseline_result['ops_per_sec']:.1f} ops/s)")
+        if result['peak_memory_kib'] > baseline_result['peak_memory_kib'] * (1 + tolerance) + MEMORY_SLACK_KIB:
+            regressions.append(f"{case}: {result['peak_memory_kib']:.1f} KiB peak memory "
+                               f"(baseline {baseline_result['peak_memory_kib']:.1f} KiB)")
+    return regressions
+
+
+def format_results(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]]) -> str:
+    lines = [f"{'benchmark':<45} {'ops/s':>12} {'vs base':>8} {'peak KiB':>10} {'vs base':>8}"]
+    for case, result in results.items():
+        baseline_result = baseline.get(case)
+        speed_ratio = memory_ratio = ''
+        if baseline_result is not None:
+            speed_ratio = f"{result['ops_per_sec'] / baseline_result['ops_per_sec']:.2f}x"
+            memory_ratio = f"{result['peak_memory_kib'] / max(baseline_result['peak_memory_kib'], 1e-9):.2f}x"
+        lines.append(f"{case:<45} {result['ops_per_sec']:>12.1f} {speed_ratio:>8} "
+                     f"{result['peak_memory_kib']:>10.1f} {memory_ratio:>8}")
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Run th2-common-utils benchmarks.')
+    parser.add_argument('-k', '--benchmark', action='append', choices=sorted(BENCHMARKS),
+                        help='Benchmark to run (all by default). Can be repeated.')
+    parser.add_argument('-s', '--shape', action='append', choices=sorted(SHAPES),
+                        help='Message shape to use (all by default). Can be repeated.')
+    parser.add_argument('--min-time', type=float, default=0.2, help='Minimal duration of one run in seconds.')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of runs; the best one is reported.')
+    parser.add_argument('--baseline', type=Path, default=BASELINE_PATH, help='Baseline file to compare with.')
+    parser.add_argument('--save-baseline', action='store_true', help='Write the results to the baseline file.')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='Allowed relative slowdown or memory growth before reporting a regression.')
+    parser.add_argument('--output', type=Path, help='Write the results to this JSON file.')
+    args = parser.parse_args(argv)
+
+    results = run(args.benchmark or list(BENCHMARKS), args.shape or list(SHAPES), args.min_time, args.repeat)
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+
+    sys.stdout.write(format_results(results, baseline) + '\n')
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(results, indent=2, sort_keys=True) + '\n')
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(dict(baseline, **results), indent=2, sort_keys=True) + '\n')
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        sys.stdout.write(f'REGRESSION {regression}\n')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
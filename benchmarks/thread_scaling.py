@@ -0,0 +1,76 @@
+#   Copyright 2022-2022 Exactpro (Exactpro Systems Limited)
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+"""Throughput of concurrent event building and publishing by a thread pool.
+
+Every task converts a message to a table, creates an event with it and adds the event to a shared
+EventBatchCollector. On regular CPython the conversion holds the GIL, so the throughput doesn't grow with the
+number of threads; on free-threaded CPython (3.13t+) it does.
+
+Usage:
+    python -m benchmarks.thread_scaling
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import sys
+import time
+from typing import List, Optional
+
+from benchmarks.generators import generate_fields, SHAPES
+
+from th2_common_utils import dict_to_message, message_to_table
+from th2_common_utils.event_utils import EventBatchCollector
+
+
+def measure_events_per_second(threads: int, tasks: int, shape_name: str) -> float:
+    message = dict_to_message(generate_fields(SHAPES[shape_name]))
+    collector = EventBatchCollector()
+
+    def publish(task_count: int) -> None:
+        for _ in range(task_count):
+            collector.create_event(book_name='book', scope='scope', body=message_to_table(message))
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        for _ in executor.map(publish, [tasks // threads] * threads):
+            pass
+    elapsed = time.perf_counter() - start
+
+    batch = collector.collect()
+    return len(batch.events) / elapsed
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Measure event publishing throughput of a thread pool.')
+    parser.add_argument('--tasks', type=int, default=4000, help='Number of events per run.')
+    parser.add_argument('-s', '--shape', default='small', choices=list(SHAPES), help='Message shape.')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8], help='Thread pool sizes.')
+    args = parser.parse_args(argv)
+
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    sys.stdout.write(f"Python {sys.version.split()[0]}, GIL {'enabled' if is_gil_enabled else 'disabled'}\n")
+    sys.stdout.write(f"{'threads':>7} {'events/s':>10} {'speedup':>8}\n")
+
+    single_thread_rate = None
+    for threads in args.threads:
+        rate = measure_events_per_second(threads, args.tasks, args.shape)
+        single_thread_rate = single_thread_rate or rate
+        sys.stdout.write(f'{threads:>7} {rate:>10.0f} {rate / single_thread_rate:>7.2f}x\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -13,6 +13,7 @@
 #   limitations under the License.
 
 import json
+from pathlib import Path
 from test.test_converters.resources import json_message, table
 from test.test_converters.resources.filters import message_filter_dict, metadata_filter_dict, \
     root_message_filter, value_filters_dict
@@ -21,16 +22,37 @@ from test.test_converters.resources.new_order_single import new_order_single_dic
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import orjson
+import pytest
+from th2_grpc_common.common_pb2 import AnyMessage, Message, MessageGroup, MessageGroupBatch, RawMessage
+
 from th2_common_utils.converters.filter_converters import dict_to_root_message_filter, \
-    dict_values_to_value_filters
-from th2_common_utils.converters.message_converters import dict_to_message, json_to_message, message_to_dict, \
-    message_to_table
+    dict_values_to_value_filters, dicts_to_root_message_filters, FieldFilter
+from th2_common_utils.converters.json_converters import json_bytes_to_message, json_lines_to_messages, \
+    message_to_json_bytes, messages_to_json_lines
+from th2_common_utils.converters.message_converters import dict_to_message, json_to_message, \
+    message_to_compact_dict, message_to_dict, message_to_table, message_to_table_pages, messages_to_comparison_table
+from th2_common_utils.converters.table_converters import columns_to_messages, read_csv_columns
+from th2_common_utils.converters.wire_converters import decode_message, decode_message_group_batch
+from th2_common_utils.event_components import TableComponent, TableLimits, TreeTableComponent
+from th2_common_utils.wire_format import WireFormatError
 
 
 def test_message_to_dict() -> None:
     assert message_to_dict(new_order_single_message) == new_order_single_dict
 
 
+def test_message_to_compact_dict() -> None:
+    compact_dicts = [message_to_compact_dict(new_order_single_message, intern_values=True) for _ in range(2)]
+    message_dict = message_to_dict(new_order_single_message)
+
+    assert compact_dicts[0]['fields'] == message_dict['fields']
+    assert compact_dicts[0]['metadata']._asdict() == dict(message_dict['metadata'], subsequence=(1, 2))  # type: ignore
+    assert all(first is second for first, second in zip(compact_dicts[0]['fields'], compact_dicts[1]['fields']))
+    assert compact_dicts[0]['fields']['OrdType'] is compact_dicts[1]['fields']['OrdType']
+    assert compact_dicts[0]['metadata'].session_alias is compact_dicts[1]['metadata'].session_alias
+
+
 def test_dict_to_message() -> None:
     assert dict_to_message(fields=new_order_single_dict['fields'],
                            parent_event_id=parent_event_id,
@@ -44,6 +66,39 @@ def test_dict_to_root_message_filter() -> None:
                                        metadata_filter=metadata_filter_dict) == root_message_filter
 
 
+def test_dicts_to_root_message_filters() -> None:
+    shared_filter = dict(message_filter_dict, field14={'Side': 1, 'Parties': dict(message_filter_dict)})
+    filters = dicts_to_root_message_filters([
+        {'message_type': 'MessageType', 'message_filter': message_filter_dict, 'metadata_filter': metadata_filter_dict},
+        {'message_type': 'OtherType', 'message_filter': shared_filter, 'ignore_fields': ['field1']},
+        {'message_type': 'OtherType', 'message_filter': dict(shared_filter, field1=FieldFilter(1, key=True))}
+    ])
+
+    assert filters[0] == root_message_filter
+    assert filters[1] == dict_to_root_message_filter(message_type='OtherType',
+                                                     message_filter=shared_filter,
+                                                     ignore_fields=['field1'])
+    assert filters[2] == dict_to_root_message_filter(message_type='OtherType',
+                                                     message_filter=dict(shared_filter,
+                                                                         field1=FieldFilter(1, key=True)))
+
+
+def test_dicts_to_root_message_filters_shared_objects() -> None:
+    parties = [{'PartyID': f'party{index}', 'PartyRole': index} for index in range(3)]
+    legs = [{'LegSymbol': 'A', 'LegParties': parties}, {'LegSymbol': 'B', 'LegParties': list(parties)}]
+    filters = [
+        {'message_type': 'NewOrderSingle', 'message_filter': {'ClOrdID': str(index), 'Parties': parties, 'Legs': legs}}
+        for index in range(3)
+    ]
+
+    assert dicts_to_root_message_filters(filters) == [dict_to_root_message_filter(**kwargs) for kwargs in filters]
+
+    # Equal values of other objects are converted to the same filters.
+    other_parties = [dict(party) for party in parties]
+    filters.append({'message_type': 'NewOrderSingle', 'message_filter': {'Parties': other_parties}})
+    assert dicts_to_root_message_filters(filters)[-1] == dict_to_root_message_filter(**filters[-1])
+
+
 def test_dict_values_to_value_filters() -> None:
     assert dict_values_to_value_filters(fields=message_filter_dict) == value_filters_dict
 
@@ -52,8 +107,187 @@ def test_message_to_table() -> None:
     assert bytes(table.tree_table) == bytes(message_to_table(table.message, sort=True))
 
 
+def test_message_to_table_limits() -> None:
+    trades = [{'Price': str(price)} for price in range(5)]
+    message = dict_to_message({'Trades': trades, 'Parties': {'Party': {'PartyID': 'party1'}}})
+
+    table = message_to_table(message, limits=TableLimits(max_rows=2, max_depth=2, max_cells=None))
+
+    assert orjson.loads(bytes(table))['rows']['Trades']['rows'] == {
+        '0': {'type': 'row', 'columns': {'Field Value': '... 1 fields'}},
+        '1': {'type': 'row', 'columns': {'Field Value': '... 1 fields'}},
+        '2': {'type': 'row', 'columns': {'Field Value': '... 3 more entries'}}
+    }
+    party_row = orjson.loads(bytes(table))['rows']['Parties']['rows']['Party']
+    assert party_row == {'type': 'row', 'columns': {'Field Value': '... 1 fields'}}
+
+    pages = list(message_to_table_pages(message, 'Trades', page_size=2, start=2))
+    assert [list(page.rows) for page in pages] == [[2, 3], [4]]
+    assert bytes(pages[0]) == bytes(message_to_table({2: {'Price': '2'}, 3: {'Price': '3'}}))  # type: ignore
+
+
+def test_message_to_table_limits_converts_emitted_entries_only() -> None:
+    message = dict_to_message({'Trades': [{'Price': str(price)} for price in range(5)], 'Side': '1'})
+    limits = TableLimits(max_rows=3, max_depth=2, max_cells=None)
+
+    message_table = message_to_table(message, limits=limits)
+    assert bytes(message_table) == bytes(message_to_table(message_to_dict(message)['fields'], limits=limits))
+
+    # Empty values can't be converted, so they fail the conversion only if they are emitted.
+    message.fields['Trades'].list_value.values.add()
+    assert bytes(message_to_table(message, limits=limits)) == bytes(message_table).replace(b'2 more', b'3 more')
+    with pytest.raises(TypeError):
+        message_to_table(message, limits=TableLimits(max_rows=None, max_depth=2, max_cells=None))
+
+
+def test_messages_to_comparison_table() -> None:
+    order = dict_to_message({'ClOrdID': '1', 'Parties': {'PartyID': 'A'}, 'Fills': ['10']})
+    ack = {'ClOrdID': '1', 'OrdStatus': '0', 'Parties': 'none', 'Fills': ['10', '20']}
+
+    expected_table = TreeTableComponent(columns_names=['Order', 'Ack'], sort=True)
+    expected_table.add_row('ClOrdID', '1', '1')
+    parties_table = TableComponent(columns_names=['Order', 'Ack'])
+    parties_table.add_row('(value)', '', 'none')
+    parties_table.add_row('PartyID', 'A', '')
+    expected_table.add_table('Parties', parties_table)
+    fills_table = TableComponent(columns_names=['Order', 'Ack'])
+    fills_table.add_row(0, '10', '10')
+    fills_table.add_row(1, '', '20')
+    expected_table.add_table('Fills', fills_table)
+    expected_table.add_row('OrdStatus', '', '0')
+
+    table = messages_to_comparison_table([order, ack], columns_names=['Order', 'Ack'], sort=True)
+    assert bytes(table) == bytes(expected_table)
+
+
 @patch('json.load')
 def test_json_to_message(json_load: Any) -> None:
     json_load.return_value = json.loads(json_message.json_message)
 
     assert json_to_message(json_path=MagicMock()) == json_message.message
+
+
+def test_message_to_json_bytes() -> None:
+    message = Message()
+    message.CopyFrom(new_order_single_message)
+    message.metadata.id.timestamp.FromNanoseconds(1_650_000_000_123_456_789)
+    message.fields['Text'].simple_value = 'Quote " and \\ and ü'
+    message.fields['Empty'].message_value.SetInParent()
+
+    json_bytes = message_to_json_bytes(message)
+
+    assert json_bytes == orjson.dumps(message_to_dict(message))
+    assert message_to_dict(json_bytes_to_message(json_bytes)) == message_to_dict(message)
+
+
+def test_messages_to_json_lines() -> None:
+    message = Message()
+    message.CopyFrom(new_order_single_message)
+    message.metadata.id.timestamp.FromNanoseconds(1_650_000_000_123_456_789)
+
+    json_lines = messages_to_json_lines([message, new_order_single_message], timestamp_format='nanos',
+                                        only_fields=['Price', 'TradingParty', 'Unknown'])
+    first_message, second_message = json_lines_to_messages(json_lines, timestamp_format='nanos')
+
+    assert json_lines.count(b'\n') == 2
+    assert orjson.loads(json_lines.splitlines()[0])['metadata']['timestamp'] == 1_650_000_000_123_456_789
+    assert first_message.metadata == message.metadata
+    assert second_message.metadata == new_order_single_message.metadata
+    assert sorted(first_message.fields) == ['Price', 'TradingParty']
+    assert first_message.fields['TradingParty'] == message.fields['TradingParty']
+
+
+def test_decode_message() -> None:
+    message = Message()
+    message.CopyFrom(new_order_single_message)
+    message.metadata.id.timestamp.FromNanoseconds(1_650_000_000_123_456_789)
+    message.fields['Text'].simple_value = 'ü' * 200
+    message.fields['Empty'].list_value.SetInParent()
+    message.fields['Null'].null_value = 0
+
+    message_dict = message_to_dict(message)
+    assert decode_message(message.SerializeToString()) == message_dict
+
+    del message_dict['fields']['TradingParty'], message_dict['fields']['Text']  # type: ignore
+    assert decode_message(memoryview(message.SerializeToString()), skip_fields={'TradingParty', 'Text'}) == message_dict
+    with pytest.raises(WireFormatError):
+        decode_message(message.SerializeToString()[:-1])
+
+
+def test_decode_message_group_batch() -> None:
+    batch = MessageGroupBatch(groups=[
+        MessageGroup(messages=[
+            AnyMessage(message=new_order_single_message),
+            AnyMessage(raw_message=RawMessage(body=b'raw'))
+        ]),
+        MessageGroup(messages=[AnyMessage(message=table.message)])
+    ])
+
+    expected_groups = [[message_to_dict(new_order_single_message)], [message_to_dict(table.message)]]
+    assert decode_message_group_batch(bytearray(batch.SerializeToString())) == expected_groups
+
+    del expected_groups[0][0]['fields']['TradingParty']  # type: ignore
+    assert decode_message_group_batch(batch.SerializeToString(), skip_fields={'TradingParty'}) == expected_groups
+
+
+def test_columns_to_messages(tmp_path: Path) -> None:
+    csv_path = tmp_path / 'orders.csv'
+    csv_path.write_text('alias,ClOrdID,Price,PartyID\nsession1,1,10.5,party1\nsession2,2,,party2\n')
+    table = read_csv_columns(csv_path)
+    table['Price'][1] = None  # type: ignore
+
+    messages = columns_to_messages(table,
+                                   fields={'ClOrdID': 'ClOrdID', 'Price': 'Price', 'PartyID': 'Parties.PartyID'},
+                                   metadata={'session_alias': 'alias'},
+                                   message_type='NewOrderSingle',
+                                   start_sequence=10)
+
+    assert messages == [
+        dict_to_message({'ClOrdID': '1', 'Price': '10.5', 'Parties': {'PartyID': 'party1'}},
+                        message_type='NewOrderSingle', session_alias='session1', sequence=10),
+        dict_to_message({'ClOrdID': '2', 'Parties': {'PartyID': 'party2'}},
+                        message_type='NewOrderSingle', session_alias='session2', sequence=11)
+    ]
+
+
+def test_columns_to_messages_missing_values() -> None:
+    pandas = pytest.importorskip('pandas')
+    numpy = pytest.importorskip('numpy')
+    table = {
+        'ClOrdID': ['1', '2'],
+        'Price': [float('nan'), '10.5'],
+        'Side': numpy.array([numpy.nan, 'BUY'], dtype=object),
+        'timestamp': pandas.Series(pandas.to_datetime([None, 1_650_000_000_000_000_000]))
+    }
+
+    messages = columns_to_messages(table, metadata={'timestamp': 'timestamp'})
+    fields = [message_to_dict(message)['fields'] for message in messages]
+
+    message_ids = [message.metadata.id for message in messages]
+
+    assert fields == [{'ClOrdID': '1'}, {'ClOrdID': '2', 'Price': '10.5', 'Side': 'BUY'}]
+    assert not message_ids[0].HasField('timestamp')
+    assert message_ids[1].timestamp.ToNanoseconds() == 1_650_000_000_000_000_000
+
+
+def test_columns_to_messages_conflicting_paths() -> None:
+    with pytest.raises(TypeError):
+        columns_to_messages({'A': ['1'], 'AB': ['2']}, fields={'A': 'A', 'AB': 'A.B'})
+    with pytest.raises(TypeError):
+        columns_to_messages({'AB': ['2'], 'A': ['1']}, fields={'AB': 'A.B', 'A': 'A'})
+    with pytest.raises(TypeError):
+        columns_to_messages({'A': ['1'], 'AB': ['2']}, fields={'A': 'A[0]', 'AB': 'A[0].B'})
+
+
+def test_columns_to_messages_numpy() -> None:
+    numpy = pytest.importorskip('numpy')
+    rows = [(1, 1.5, 1_650_000_000_000_000_000), (2, numpy.nan, 1_650_000_000_000_000_001)]
+    table = numpy.array(rows, dtype=[('Quantity', 'i8'), ('Price', 'f8'), ('timestamp', 'datetime64[ns]')])
+
+    messages = columns_to_messages(table, metadata={'timestamp': 'timestamp'})
+    fields = [message_to_dict(message)['fields'] for message in messages]
+
+    timestamp = messages[1].metadata.id.timestamp
+
+    assert fields == [{'Quantity': '1', 'Price': '1.5'}, {'Quantity': '2'}]
+    assert timestamp.ToNanoseconds() == 1_650_000_000_000_000_001
@@ -0,0 +1,45 @@
+#   Copyright 2022-2022 Exactpro (Exactpro Systems Limited)
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+from concurrent.futures import ThreadPoolExecutor
+import sys
+
+from th2_common_utils.event_components import TableComponent
+from th2_common_utils.event_utils import EventBatchCollector
+
+
+def test_event_batch_collector_threads() -> None:
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        collector = EventBatchCollector()
+        table = TableComponent(['Value'], sort=True)
+
+        def publish(thread_index: int) -> None:
+            for index in range(200):
+                table.add_row(thread_index * 1000 + index, 'value')
+                collector.create_event(book_name='book', scope='scope', name=f'{thread_index}-{index}')
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for _ in executor.map(publish, range(8)):
+                pass
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    batch = collector.collect()
+    assert len(batch.events) == 1600
+    assert len({event.id.id for event in batch.events}) == 1600
+    assert list(table.rows) == sorted(thread_index * 1000 + index for thread_index in range(8) for index in range(200))
+    assert len(collector) == 0 and not collector.collect().events
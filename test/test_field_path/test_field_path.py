@@ -0,0 +1,96 @@
+#   Copyright 2022-2022 Exactpro (Exactpro Systems Limited)
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+from test.test_converters.resources.new_order_single import new_order_single_message
+
+import pytest
+from th2_grpc_common.common_pb2 import Message
+
+from th2_common_utils.converters.message_converters import dict_to_message, message_to_dict
+from th2_common_utils.field_path import compile_field_path, format_field_path, get_field, get_field_values, \
+    parse_field_path, set_field, update_fields
+
+
+def test_parse_field_path() -> None:
+    assert parse_field_path('TradingParty.NoPartyIDs[-1].PartyID') == ('TradingParty', 'NoPartyIDs', -1, 'PartyID')
+    assert format_field_path(('TradingParty', 'NoPartyIDs', -1, 'PartyID')) == 'TradingParty.NoPartyIDs[-1].PartyID'
+
+    for invalid_path in ('', '.A', 'A..B', '[0]', 'A[x]', 'A.'):
+        with pytest.raises(ValueError):
+            parse_field_path(invalid_path)
+
+
+def test_get_field() -> None:
+    assert get_field(new_order_single_message, 'TradingParty.NoPartyIDs[1].PartyIDSource') == 'A'
+    assert isinstance(get_field(new_order_single_message, 'TradingParty'), Message)
+    assert get_field(new_order_single_message, 'TradingParty.NoPartyIDs[2].PartyID', None) is None
+
+    with pytest.raises(KeyError):
+        get_field(new_order_single_message, 'OrdType.PartyID')
+
+
+def test_get_field_values() -> None:
+    path = compile_field_path('TradingParty.NoPartyIDs[0].PartyRole')
+
+    assert compile_field_path('TradingParty.NoPartyIDs[0].PartyRole') is path
+    assert path.get_many([new_order_single_message, Message()], default='') == ['11', '']
+    assert get_field_values([new_order_single_message] * 2, 'OrdType') == ['1', '1']
+
+
+def test_set_field() -> None:
+    message = dict_to_message({'Parties': {'PartyIDs': [{'PartyID': '1'}, {'PartyID': '2'}]}})
+    set_field(message, 'Parties.PartyIDs[-1].PartyID', 3)
+    set_field(message, 'Instrument.Symbol', 'ABC')
+
+    assert message_to_dict(message)['fields'] == {
+        'Parties': {'PartyIDs': [{'PartyID': '1'}, {'PartyID': '3'}]},
+        'Instrument': {'Symbol': 'ABC'}
+    }
+
+    with pytest.raises(KeyError):
+        set_field(message, 'Parties.PartyIDs[2].PartyID', '4')
+    with pytest.raises(TypeError):
+        set_field(message, 'Instrument.Symbol.Suffix', 'X')
+
+
+def test_set_field_failed() -> None:
+    message = dict_to_message({'Instrument': {'Symbol': 'ABC'}})
+    expected = Message()
+    expected.CopyFrom(message)
+
+    with pytest.raises(KeyError):
+        set_field(message, 'Parties.PartyIDs[0]', '1')
+    with pytest.raises(TypeError):
+        set_field(message, 'Instrument.Parties.PartyID', object())
+    for path in ('Instrument', 'Instrument.Symbol', 'Instrument.Legs', 'Parties'):
+        with pytest.raises(TypeError):
+            set_field(message, path, {'Symbol': 'XYZ', 'Side': object()})
+        with pytest.raises(TypeError):
+            set_field(message, path, ['1', [object()]])
+        with pytest.raises(TypeError):
+            update_fields(message, {path: {'Symbol': 'XYZ', 'Side': object()}}, merge=True)
+
+    assert message == expected
+    assert message_to_dict(message)['fields'] == {'Instrument': {'Symbol': 'ABC'}}
+
+
+def test_update_fields() -> None:
+    message = dict_to_message({'Price': '1', 'Instrument': {'Symbol': 'ABC', 'SecurityID': '1'}})
+    update_fields(message, {'Price': '2', 'Instrument': {'SecurityID': '2'}, 'Legs': []}, merge=True)
+
+    assert message_to_dict(message)['fields'] == {
+        'Price': '2',
+        'Instrument': {'Symbol': 'ABC', 'SecurityID': '2'},
+        'Legs': []
+    }
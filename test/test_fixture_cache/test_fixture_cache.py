@@ -0,0 +1,42 @@
+#   Copyright 2022-2022 Exactpro (Exactpro Systems Limited)
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import os
+from pathlib import Path
+from test.test_converters.resources import json_message
+from unittest.mock import patch
+
+from th2_common_utils.fixture_cache import FixtureCache
+
+
+def test_fixture_cache(tmp_path: Path) -> None:
+    json_path = tmp_path / 'message.json'
+    json_path.write_text(json_message.json_message)
+    cache_dir = tmp_path / 'cache'
+
+    message = FixtureCache(cache_dir=cache_dir).load(json_path)
+    message.fields['new'].simple_value = 'changed'
+
+    with patch('th2_common_utils.fixture_cache.json_to_message') as json_to_message:
+        cache = FixtureCache(cache_dir=cache_dir)
+        assert cache.load(json_path) == json_message.message
+        assert cache.load(json_path) == json_message.message
+        json_to_message.assert_not_called()
+    assert len(cache) == 1
+
+    json_path.write_text(json_message.json_message.replace('CLIENT1', 'CLIENT2'))
+    os.utime(json_path, ns=(0, 0))
+    assert cache.load(json_path) != json_message.message
+    assert len(list(cache_dir.iterdir())) == 1
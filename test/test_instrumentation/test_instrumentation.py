@@ -0,0 +1,74 @@
+#   Copyright 2022-2022 Exactpro (Exactpro Systems Limited)
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+from test.test_converters.resources.new_order_single import new_order_single_message
+from typing import Any, Iterator, List
+
+import pytest
+
+from th2_common_utils.converters.message_converters import message_to_dict, message_to_table
+from th2_common_utils.event_utils import create_event
+from th2_common_utils.instrumentation import add_metrics_callback, disable_instrumentation, \
+    enable_instrumentation, get_metrics, metrics_to_prometheus, remove_metrics_callback, reset_metrics
+
+
+@pytest.fixture()
+def instrumentation() -> Iterator[None]:
+    reset_metrics()
+    enable_instrumentation(measure_sizes=True)
+    yield
+    disable_instrumentation()
+    reset_metrics()
+
+
+def test_metrics_are_not_collected_by_default() -> None:
+    message_to_dict(new_order_single_message)
+
+    assert get_metrics() == {}
+
+
+def test_get_metrics(instrumentation: None) -> None:
+    calls: List[str] = []
+
+    def callback(api: str, *metrics: Any) -> None:
+        calls.append(api)
+
+    add_metrics_callback(callback)
+    message_to_dict(new_order_single_message)
+    event = create_event(body=message_to_table(new_order_single_message))
+    remove_metrics_callback(callback)
+
+    metrics = get_metrics()
+
+    assert metrics['message_to_dict']['calls'] == 2
+    assert metrics['message_to_dict']['nodes'] == 28
+    assert metrics['message_to_table']['nodes'] == 14
+    assert metrics['create_event_body']['bytes'] == len(event.body)
+    assert calls == ['message_to_dict', 'message_to_dict', 'message_to_table', 'create_event_body', 'create_event']
+    assert 'th2_common_utils_calls_total{api="message_to_dict"} 2\n' in metrics_to_prometheus()
+
+
+def test_sizes_are_not_measured_by_default() -> None:
+    reset_metrics()
+    enable_instrumentation()
+    try:
+        message_to_dict(new_order_single_message)
+    finally:
+        disable_instrumentation()
+
+    metrics = get_metrics()
+    reset_metrics()
+
+    assert metrics['message_to_dict']['calls'] == 1
+    assert metrics['message_to_dict']['nodes'] == 0
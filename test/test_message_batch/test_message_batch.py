@@ -0,0 +1,55 @@
+#   Copyright 2022-2022 Exactpro (Exactpro Systems Limited)
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+from test.test_converters.resources.new_order_single import new_order_single_message
+
+from th2_grpc_common.common_pb2 import ConnectionID, Direction, EventID, MessageID, RawMessage, RawMessageMetadata
+
+from th2_common_utils.converters.metadata_converters import message_metadata_to_dict, raw_message_metadata_to_dict
+from th2_common_utils.message_batch import build_message_group_batch, iter_batch_messages, iter_raw_messages, \
+    raw_message_body
+
+
+raw_message = RawMessage(metadata=RawMessageMetadata(id=MessageID(connection_id=ConnectionID(session_alias='alias'),
+                                                                  direction=Direction.SECOND,
+                                                                  sequence=7,
+                                                                  book_name='book'),
+                                                     properties={'prop': 'value'},
+                                                     protocol='FIX'),
+                         body=b'8=FIX.4.4|35=D|',
+                         parent_event_id=EventID(id='event'))
+
+
+def test_build_and_iter_batch_messages() -> None:
+    batch = build_message_group_batch([new_order_single_message, raw_message, raw_message], group_size=2)
+
+    assert [len(group.messages) for group in batch.groups] == [2, 1]
+    assert list(iter_batch_messages(batch)) == [(0, new_order_single_message), (0, raw_message), (1, raw_message)]
+    assert raw_message_body(raw_message)[2:5] == b'FIX'
+
+
+def test_iter_raw_messages() -> None:
+    batch = build_message_group_batch([raw_message, new_order_single_message, raw_message])
+    data = bytearray(batch.SerializeToString())
+
+    views = list(iter_raw_messages(data))
+
+    assert [view.group_index for view in views] == [0, 2]
+    assert isinstance(views[0].body, memoryview) and views[0].body.obj is data
+    assert views[1].body == raw_message.body
+    assert views[1].parent_event_id == raw_message.parent_event_id
+    assert views[1].to_raw_message() == raw_message
+    assert views[1].metadata_to_dict() == raw_message_metadata_to_dict(raw_message.metadata)
+    metadata_keys = message_metadata_to_dict(new_order_single_message.metadata).keys()
+    assert raw_message_metadata_to_dict(raw_message.metadata).keys() == metadata_keys
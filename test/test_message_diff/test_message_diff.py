@@ -0,0 +1,48 @@
+#   Copyright 2022-2022 Exactpro (Exactpro Systems Limited)
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+from test.test_converters.resources.new_order_single import new_order_single_dict, new_order_single_message
+
+from th2_common_utils.converters.message_converters import dict_to_message
+from th2_common_utils.message_diff import diff_messages, FieldDiff, messages_equal, MISSING
+
+
+actual_party = {'PartyID': '1', 'PartyIDSource': 'A', 'PartyRole': '11'}
+actual_message = dict_to_message(dict(new_order_single_dict['fields'],
+                                      OrdType='2',
+                                      TransactTime=None,
+                                      TradingParty={'NoPartyIDs': [actual_party]}))
+
+
+def test_diff_messages() -> None:
+    assert diff_messages(new_order_single_message, new_order_single_message) == []
+    diffs = [
+        FieldDiff('OrdType', '1', '2'),
+        FieldDiff('TradingParty.NoPartyIDs[1]', {'PartyID': '2', 'PartyIDSource': 'A', 'PartyRole': '12'}, MISSING),
+        FieldDiff('TransactTime', MISSING, None)
+    ]
+
+    assert sorted(diff_messages(new_order_single_message, actual_message), key=lambda diff: diff.path) == diffs
+
+    limited_diffs = diff_messages(new_order_single_message, actual_message, ignore_fields=['OrdType'], max_diffs=1)
+    assert len(limited_diffs) == 1 and limited_diffs[0] in diffs[1:]
+
+
+def test_messages_equal() -> None:
+    assert messages_equal(new_order_single_message, dict_to_message(new_order_single_dict['fields']))
+    assert not messages_equal(new_order_single_message, actual_message)
+    assert not messages_equal(new_order_single_message, actual_message,
+                              ignore_fields=['OrdType', 'TransactTime'])
+    assert messages_equal(new_order_single_message, actual_message,
+                          ignore_fields=['OrdType', 'TransactTime', 'NoPartyIDs'])
@@ -0,0 +1,55 @@
+#   Copyright 2022-2022 Exactpro (Exactpro Systems Limited)
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+from test.test_converters.resources.new_order_single import new_order_single_dict
+
+import pytest
+
+from th2_common_utils.converters.message_converters import dict_to_message
+from th2_common_utils.message_factory import MessageFactory
+
+
+def test_message_factory() -> None:
+    fields = new_order_single_dict['fields']
+    factory = MessageFactory(session_alias='session', book_name='book', protocol='FIX', start_sequence=5)
+
+    message = factory.message(fields, message_type='NewOrderSingle', properties={'key': 'value'}, timestamp_ns=1_001)
+    expected = dict_to_message(fields, message_type='NewOrderSingle', session_alias='session', book_name='book',
+                               sequence=5, properties={'key': 'value'}, protocol='FIX')
+    expected.metadata.id.timestamp.nanos = 1_001
+    assert message == expected
+
+    batch = factory.batch([fields] * 3, message_type='ExecutionReport', group_size=2, properties={'key': 'value'})
+    batch_messages = [any_message.message for group in batch.groups for any_message in group.messages]
+    assert [len(group.messages) for group in batch.groups] == [2, 1]
+    assert [message.metadata.id.sequence for message in batch_messages] == [6, 7, 8]
+    assert all(message.metadata.message_type == 'ExecutionReport' for message in batch_messages)
+    assert all(message.metadata.id.HasField('timestamp') for message in batch_messages)
+    assert all(message.metadata.properties == {'key': 'value'} for message in batch_messages)
+
+    messages = factory.messages([fields] * 2, properties={'key': 'value'})
+    assert [message.metadata.id.sequence for message in messages] == [9, 10]
+    assert all(message.metadata.properties == {'key': 'value'} for message in messages)
+
+
+def test_message_factory_failed_message() -> None:
+    factory = MessageFactory(session_alias='session')
+
+    with pytest.raises(TypeError):
+        factory.message({'ClOrdID': object()})
+    with pytest.raises(TypeError):
+        factory.messages([{'ClOrdID': '1'}, {'ClOrdID': object()}])
+
+    assert factory.message({'ClOrdID': '1'}).metadata.id.sequence == 2
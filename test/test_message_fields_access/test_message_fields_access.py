@@ -12,9 +12,16 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
-from test.test_converters.resources.new_order_single import new_order_single_message
+from test.test_converters.resources.new_order_single import new_order_single_dict, new_order_single_message
 
-from th2_common_utils.message_fields_access import *  # noqa: F401, F403
+import pytest
+from th2_grpc_common.common_pb2 import Message
+
+from th2_common_utils.converters.message_converters import dict_to_message, message_to_dict
+from th2_common_utils.message_fields_access import enable_message_fields_access
+
+
+enable_message_fields_access()
 
 
 def test_message_fields_access() -> None:
@@ -24,3 +31,46 @@ def test_message_fields_access() -> None:
     party_id_source_easy_access = new_order_single_message['TradingParty']['NoPartyIDs'][1]['PartyIDSource']
 
     assert party_id_source_easy_access == party_id_source
+
+
+def test_enable_message_fields_access_is_idempotent() -> None:
+    getitem = Message.__getitem__
+    enable_message_fields_access()
+
+    assert Message.__getitem__ is getitem
+
+
+def test_message_update() -> None:
+    message = Message()
+    message.update(new_order_single_dict['fields'], OrdType='2')
+
+    assert message_to_dict(message)['fields'] == dict(new_order_single_dict['fields'], OrdType='2')
+
+
+def test_message_merge() -> None:
+    message = dict_to_message({'Instrument': {'Symbol': 'ABC', 'SecurityID': '1'}, 'Legs': [{'Qty': '1'}]})
+    message.merge({'Instrument': {'SecurityID': '2'}, 'Legs': [{'Price': '3'}]})
+
+    assert message_to_dict(message)['fields'] == {
+        'Instrument': {'Symbol': 'ABC', 'SecurityID': '2'},
+        'Legs': [{'Price': '3'}]
+    }
+
+
+def test_failed_setitem_keeps_message() -> None:
+    message = dict_to_message({'A': {'x': '1'}, 'B': ['1']})
+    expected = Message()
+    expected.CopyFrom(message)
+
+    invalid_values = ({'x': '9', 'z': object()}, [object()], ['2', {'y': object()}], {1: '2'})
+    for field in ('A', 'B', 'C'):
+        for invalid_value in invalid_values:
+            with pytest.raises(TypeError):
+                message[field] = invalid_value
+            with pytest.raises(TypeError):
+                message.update({'D': '1', field: invalid_value})
+            with pytest.raises(TypeError):
+                message.merge({'D': '1', field: invalid_value})
+
+    assert message == expected
+    assert message_to_dict(message)['fields'] == {'A': {'x': '1'}, 'B': ['1']}
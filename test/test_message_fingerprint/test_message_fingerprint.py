@@ -0,0 +1,45 @@
+#   Copyright 2022-2022 Exactpro (Exactpro Systems Limited)
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+from test.test_converters.resources.new_order_single import new_order_single_dict, new_order_single_message
+
+from th2_common_utils.converters.message_converters import dict_to_message
+from th2_common_utils.message_fingerprint import DedupWindow, message_fingerprint
+
+
+def test_message_fingerprint() -> None:
+    fields = new_order_single_dict['fields']
+    message = dict_to_message(fields, message_type='NewOrderSingle', session_alias='feed_a', sequence=1)
+    reordered_message = dict_to_message(dict(reversed(list(fields.items()))),
+                                        message_type='NewOrderSingle',
+                                        session_alias='feed_b',
+                                        sequence=2)
+
+    assert message_fingerprint(message) == message_fingerprint(reordered_message)
+    assert message_fingerprint(message, skip_metadata=()) != message_fingerprint(reordered_message, skip_metadata=())
+    assert message_fingerprint(message) != message_fingerprint(dict_to_message(dict(fields, Price='101'),
+                                                                               message_type='NewOrderSingle'))
+    assert len(message_fingerprint(message, digest_size=8)) == 8
+
+
+def test_dedup_window() -> None:
+    messages = [dict_to_message({'ClOrdID': str(i % 3)}) for i in range(6)] + [new_order_single_message]
+    dedup_window = DedupWindow(max_size=2)
+
+    assert list(dedup_window.drop_duplicates(messages[:6])) == messages[:6]
+    assert len(dedup_window) == 2
+
+    dedup_window = DedupWindow(max_size=3)
+
+    assert list(dedup_window.drop_duplicates(messages)) == messages[:3] + [new_order_single_message]
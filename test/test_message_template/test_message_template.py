@@ -0,0 +1,56 @@
+#   Copyright 2022-2022 Exactpro (Exactpro Systems Limited)
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+from test.test_converters.resources.new_order_single import new_order_single_message
+
+from th2_grpc_common.common_pb2 import Message
+
+from th2_common_utils.field_path import update_fields
+from th2_common_utils.message_template import MessageTemplate
+
+
+def test_message_template() -> None:
+    template = MessageTemplate(new_order_single_message)
+    overrides = {
+        'ClOrdID': 'order-2',
+        'Price': 10.5,
+        'TradingParty.NoPartyIDs[0].PartyID': 'party-2',
+        'Instrument': {'Symbol': 'ABC'}
+    }
+    expected = Message()
+    expected.CopyFrom(new_order_single_message)
+    update_fields(expected, overrides)
+
+    assert template.variant(overrides) == expected
+    variant_bytes = template.variant_bytes({'ClOrdID': 'order-2'})
+    assert Message.FromString(variant_bytes) == template.variant({'ClOrdID': 'order-2'})
+
+    batch = template.variants_batch([{'ClOrdID': str(index)} for index in range(3)], group_size=2)
+    variants = [template.variant({'ClOrdID': str(index)}) for index in range(3)]
+    batch_groups = [[any_message.message for any_message in group.messages] for group in batch.groups]
+    assert batch_groups == [variants[:2], variants[2:]]
+
+
+def test_message_template_overlapping_overrides() -> None:
+    template = MessageTemplate(new_order_single_message)
+
+    for overrides in ({'Instrument.Symbol': 'X', 'Instrument': {'ID': '2'}},
+                      {'Instrument': {'ID': '2'}, 'Instrument.Symbol': 'X'}):
+        expected = Message()
+        expected.CopyFrom(new_order_single_message)
+        update_fields(expected, overrides)
+
+        assert template.variant(overrides) == expected
+        assert Message.FromString(template.variant_bytes(overrides)) == expected
@@ -0,0 +1,44 @@
+#   Copyright 2022-2022 Exactpro (Exactpro Systems Limited)
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+from collections import defaultdict, namedtuple, OrderedDict
+from test.test_converters.resources.new_order_single import new_order_single_message
+
+from th2_common_utils.converters.message_converters import dict_to_message, message_to_dict
+from th2_common_utils.event_components import MessageComponent
+from th2_common_utils.rendering import render, RenderLimits, UNLIMITED
+
+
+def test_render() -> None:
+    data = {'list': list(range(5)), 'tuple': (1,), 'nested': {'a': {'b': {'c': None}}}, 'float': 0.5}
+
+    assert render(data) == str(data)
+    assert render(new_order_single_message, UNLIMITED) == str(message_to_dict(new_order_single_message))
+    assert render(data, RenderLimits(max_depth=2, max_items=2)) == "{'list': [0, 1, ...(3 more)], " \
+                                                                   "'tuple': (1,), ...(2 more)}"
+    value = dict_to_message({'a': {'b': {'c': '1'}}}).fields['a']
+    assert render(value, RenderLimits(max_depth=1)) == "{'b': {...}}"
+    assert render('x' * 100, RenderLimits(max_chars=10)) == 'x' * 7 + '...'
+
+    point = namedtuple('Point', 'x y')(1, 2)
+    for obj in (point, OrderedDict(a=1), defaultdict(list, a=[1]), {'point': point, 'ordered': [OrderedDict(a=1)]}):
+        assert render(obj) == str(obj)
+
+
+def test_message_component_render_limits() -> None:
+    message = dict_to_message({'NoPartyIDs': [{'PartyID': str(i)} for i in range(10_000)]})
+
+    assert len(MessageComponent(message, RenderLimits(max_chars=1000)).data) == 1000
+    assert MessageComponent(message).data == str(message)
+    assert MessageComponent([1, 2]).data == '[1, 2]'
@@ -0,0 +1,48 @@
+#   Copyright 2022-2022 Exactpro (Exactpro Systems Limited)
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import pickle
+
+from th2_common_utils.converters.message_converters import dict_to_message
+from th2_common_utils.schema_profiler import SchemaProfiler
+
+
+def test_schema_profiler() -> None:
+    messages = []
+    for index in range(200):
+        parties = [{'PartyID': str(index % 3)}] * (index % 4)
+        fields = {'ClOrdID': str(index), 'Parties': parties, 'Text': None if index % 2 else 'text'}
+        messages.append(dict_to_message(fields, message_type='NewOrderSingle'))
+    profiler = SchemaProfiler()
+    profiler.add_many(messages[:100])
+    other_profiler = SchemaProfiler()
+    other_profiler.add_many(messages[100:])
+    profiler.merge(pickle.loads(pickle.dumps(other_profiler)))
+
+    fields = profiler.to_dict()['NewOrderSingle']['fields']
+    assert profiler.message_counts == {'NewOrderSingle': 200}
+    assert sorted(fields) == ['ClOrdID', 'Parties', 'Parties[*]', 'Parties[*].PartyID', 'Text']
+    assert 190 <= fields['ClOrdID']['cardinality'] <= 210
+    assert fields['Parties'] == {'count': 200, 'kinds': {'list': 200}, 'cardinality': 0, 'max_list_length': 3}
+    assert fields['Parties[*].PartyID']['cardinality'] == 3
+    assert fields['Text']['kinds'] == {'simple': 100, 'null': 100}
+
+
+def test_schema_profiler_max_paths() -> None:
+    profiler = SchemaProfiler(max_paths=2)
+    profiler.add(dict_to_message({'A': '1', 'B': '2', 'C': '3', 'D': '4'}))
+
+    assert len(profiler.profiles['']) == 2
+    assert profiler.dropped_values == 2
@@ -12,9 +12,108 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
-from .converters.filter_converters import dict_to_metadata_filter, dict_to_root_message_filter, \
-    dict_values_to_value_filters
-from .converters.message_converters import dict_to_message, json_to_message, message_to_dict, message_to_table
-from .event_components import MessageComponent, TableComponent, TreeTableComponent
-from .event_utils import create_event, create_event_id, create_timestamp
-from .message_fields_access import *
+"""Python library with useful functions for developers and QA needs.
+
+Public names are imported lazily on the first access, so `import th2_common_utils` doesn't load protobuf,
+orjson or any of the submodules. th2 Message, Value and ListValue classes are not patched on import anymore:
+call `enable_message_fields_access()` to get dict-like access to the message fields.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+
+# typing is not imported at runtime as it takes a noticeable part of the import time.
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, List  # noqa: I300
+
+    from .converters.filter_converters import (
+        dict_to_metadata_filter, dict_to_root_message_filter, dict_values_to_value_filters,
+        dicts_to_root_message_filters)
+    from .converters.json_converters import (
+        json_bytes_to_message, json_lines_to_messages, message_to_json_bytes, messages_to_json_lines)
+    from .converters.message_converters import (
+        dict_to_message, json_to_message, message_to_compact_dict, message_to_dict, message_to_table,
+        message_to_table_pages, messages_to_comparison_table)
+    from .converters.metadata_converters import (
+        message_metadata_to_dict, message_metadata_to_record, MessageMetadataRecord, raw_message_metadata_to_dict)
+    from .converters.table_converters import columns_to_messages, read_csv_columns
+    from .converters.wire_converters import decode_message, decode_message_group_batch
+    from .event_components import MessageComponent, TableComponent, TableLimits, TreeTableComponent
+    from .event_utils import create_event, create_event_id, create_timestamp, EventBatchCollector
+    from .field_path import compile_field_path, FieldPath, get_field, get_field_values, set_field, update_fields
+    from .fixture_cache import FixtureCache
+    from .instrumentation import (
+        disable_instrumentation, enable_instrumentation, get_metrics, metrics_to_prometheus)
+    from .message_batch import (
+        build_message_group_batch, iter_batch_messages, iter_raw_messages, raw_message_body, RawMessageView)
+    from .message_diff import diff_messages, FieldDiff, messages_equal, MISSING
+    from .message_factory import MessageFactory
+    from .message_fields_access import (
+        enable_message_fields_access, listvalue_getitem, listvalue_len, message_contains, message_getitem,
+        message_merge, message_repr, message_setitem, message_update, SimpleType, value_get)
+    from .message_fingerprint import DedupWindow, message_fingerprint
+    from .message_template import MessageTemplate
+    from .rendering import DEFAULT_RENDER_LIMITS, render, RenderLimits
+    from .schema_profiler import FieldProfile, SchemaProfiler
+    from .wire_format import WireFormatError
+
+
+_EXPORTS: Dict[str, List[str]] = {
+    '.converters.filter_converters': [
+        'dict_to_metadata_filter', 'dict_to_root_message_filter', 'dict_values_to_value_filters',
+        'dicts_to_root_message_filters'
+    ],
+    '.converters.json_converters': [
+        'json_bytes_to_message', 'json_lines_to_messages', 'message_to_json_bytes', 'messages_to_json_lines'
+    ],
+    '.converters.message_converters': [
+        'dict_to_message', 'json_to_message', 'message_to_compact_dict', 'message_to_dict', 'message_to_table',
+        'message_to_table_pages', 'messages_to_comparison_table'
+    ],
+    '.converters.metadata_converters': [
+        'message_metadata_to_dict', 'message_metadata_to_record', 'MessageMetadataRecord',
+        'raw_message_metadata_to_dict'
+    ],
+    '.converters.table_converters': ['columns_to_messages', 'read_csv_columns'],
+    '.converters.wire_converters': ['decode_message', 'decode_message_group_batch'],
+    '.event_components': ['MessageComponent', 'TableComponent', 'TableLimits', 'TreeTableComponent'],
+    '.event_utils': ['create_event', 'create_event_id', 'create_timestamp', 'EventBatchCollector'],
+    '.field_path': ['compile_field_path', 'FieldPath', 'get_field', 'get_field_values', 'set_field', 'update_fields'],
+    '.fixture_cache': ['FixtureCache'],
+    '.instrumentation': ['disable_instrumentation', 'enable_instrumentation', 'get_metrics', 'metrics_to_prometheus'],
+    '.message_batch': [
+        'build_message_group_batch', 'iter_batch_messages', 'iter_raw_messages', 'raw_message_body', 'RawMessageView'
+    ],
+    '.message_diff': ['diff_messages', 'FieldDiff', 'messages_equal', 'MISSING'],
+    '.message_factory': ['MessageFactory'],
+    '.message_fields_access': [
+        'enable_message_fields_access', 'listvalue_getitem', 'listvalue_len', 'message_contains', 'message_getitem',
+        'message_merge', 'message_repr', 'message_setitem', 'message_update', 'SimpleType', 'value_get'
+    ],
+    '.message_fingerprint': ['DedupWindow', 'message_fingerprint'],
+    '.message_template': ['MessageTemplate'],
+    '.rendering': ['DEFAULT_RENDER_LIMITS', 'render', 'RenderLimits'],
+    '.schema_profiler': ['FieldProfile', 'SchemaProfiler'],
+    '.wire_format': ['WireFormatError'],
+}
+
+_MODULE_BY_NAME = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = list(_MODULE_BY_NAME)
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULE_BY_NAME.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + __all__)
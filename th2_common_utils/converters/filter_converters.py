@@ -12,12 +12,14 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple, Union
 
 from google.protobuf.duration_pb2 import Duration
 from th2_grpc_common.common_pb2 import FilterOperation, ListValueFilter, MessageFilter, MetadataFilter, \
     RootComparisonSettings, RootMessageFilter, SimpleList, ValueFilter
 
+from th2_common_utils.instrumentation import count_filter_nodes, instrumented
+
 
 class FieldFilter:
     __slots__ = ('value', 'operation', 'key')
@@ -34,6 +36,12 @@ class FieldFilter:
 FieldsDict = Dict[str, Any]
 
 
+def _measure_root_message_filters(root_message_filters: List[RootMessageFilter]) -> Tuple[int, int]:
+    return (sum(count_filter_nodes(root_filter.message_filter.fields.values()) for root_filter in root_message_filters),
+            sum(root_filter.ByteSize() for root_filter in root_message_filters))
+
+
+@instrumented('dict_to_root_message_filter', lambda result: _measure_root_message_filters([result]))
 def dict_to_root_message_filter(message_type: str = '',
                                 message_filter: Optional[Union[FieldsDict, MessageFilter]] = None,
                                 metadata_filter: Optional[Union[FieldsDict, MetadataFilter]] = None,
@@ -60,12 +68,53 @@ def dict_to_root_message_filter(message_type: str = '',
         TypeError: Occurs when MessageFilter or MetadataFilter as dicts contain a field of the unsupported type.
     """
 
+    return _build_root_message_filter(to_message_filter,
+                                      message_type=message_type,
+                                      message_filter=message_filter,
+                                      metadata_filter=metadata_filter,
+                                      ignore_fields=ignore_fields,
+                                      check_repeating_group_order=check_repeating_group_order,
+                                      time_precision=time_precision,
+                                      decimal_precision=decimal_precision)
+
+
+@instrumented('dicts_to_root_message_filters', _measure_root_message_filters)
+def dicts_to_root_message_filters(filters: Iterable[Dict[str, Any]]) -> List[RootMessageFilter]:
+    """Converts many dicts to RootMessageFilters at once.
+
+    Identical nested parts of the filters (e.g. the same parties or instrument blocks) are converted
+    to ValueFilter only once and then copied into every filter they occur in. Sub-dicts and sub-lists shared
+    by the filters as the same objects are walked only once, so they must not be changed until the function
+    returns (e.g. by a generator of 'filters').
+
+    Args:
+        filters: Keyword arguments of `dict_to_root_message_filter` function, one dict per filter.
+
+    Returns:
+        List of RootMessageFilter class instances in the same order as 'filters'.
+
+    Raises:
+        TypeError: Occurs when MessageFilter or MetadataFilter as dicts contain a field of the unsupported type.
+    """
+
+    cache = _ValueFilterCache()
+    return [_build_root_message_filter(cache.to_message_filter, **root_filter_args) for root_filter_args in filters]
+
+
+def _build_root_message_filter(message_filter_converter: Callable[[Dict[str, Any]], MessageFilter],
+                               message_type: str = '',
+                               message_filter: Optional[Union[FieldsDict, MessageFilter]] = None,
+                               metadata_filter: Optional[Union[FieldsDict, MetadataFilter]] = None,
+                               ignore_fields: Optional[List[str]] = None,
+                               check_repeating_group_order: bool = False,
+                               time_precision: Optional[Duration] = None,
+                               decimal_precision: str = '') -> RootMessageFilter:
     root_message_filter = RootMessageFilter(messageType=message_type)
 
     if isinstance(message_filter, MessageFilter):
         root_message_filter.message_filter.CopyFrom(message_filter)
     elif isinstance(message_filter, Dict):
-        root_message_filter.message_filter.CopyFrom(to_message_filter(message_filter))
+        root_message_filter.message_filter.CopyFrom(message_filter_converter(message_filter))
 
     if isinstance(metadata_filter, MetadataFilter):
         root_message_filter.metadata_filter.CopyFrom(metadata_filter)
@@ -126,7 +175,7 @@ def to_value_filter(value: Any) -> ValueFilter:
 
 def list_to_value_filter(list_value: list) -> ValueFilter:
     if all(isinstance(v, str) for v in list_value):
-        return ValueFilter(simple_list=SimpleList(simple_values=[str(v) for v in list_value]))
+        return ValueFilter(simple_list=SimpleList(simple_values=list_value))
     else:
         return ValueFilter(list_filter=ListValueFilter(values=[to_value_filter(v) for v in list_value]))
 
@@ -135,6 +184,93 @@ def dict_to_value_filter(dict_value: dict) -> ValueFilter:
     return ValueFilter(message_filter=MessageFilter(fields={k: to_value_filter(v) for k, v in dict_value.items()}))
 
 
+# (value, key, filter) of a converted dict or list; the value is kept to keep its id unique.
+_ConvertedValue = Tuple[Any, Hashable, ValueFilter]
+
+
+class _ValueFilterCache:
+    """Converts values to ValueFilters, building every distinct sub-filter only once.
+
+    Each converted value gets a hashable key describing its structure, so equal sub-dicts and sub-lists
+    are detected regardless of whether they are the same Python objects. Keys and filters of dicts and lists
+    are also remembered by their ids, so a sub-dict or sub-list shared by many filters is walked only once.
+    The cache keeps references to these values, so their ids aren't reused while it's alive; the values
+    must not be changed while the cache is used.
+    """
+
+    __slots__ = ('_filters', '_converted')
+
+    def __init__(self) -> None:
+        self._filters: Dict[Hashable, ValueFilter] = {}
+        self._converted: Dict[int, _ConvertedValue] = {}
+
+    def to_message_filter(self, dict_obj: Dict[str, Any]) -> MessageFilter:
+        return self.to_value_filter(dict_obj)[1].message_filter
+
+    def to_value_filter(self, value: Any) -> Tuple[Hashable, ValueFilter]:
+        if not isinstance(value, (dict, list)):
+            return self._convert(value)
+
+        converted = self._converted.get(id(value))
+        if converted is None:
+            key, value_filter = self._convert(value)
+            converted = self._converted[id(value)] = (value, key, value_filter)
+        return converted[1], converted[2]
+
+    def _convert(self, value: Any) -> Tuple[Hashable, ValueFilter]:
+        if isinstance(value, FieldFilter):
+            inner_key, inner_filter = self.to_value_filter(value.value)
+            key: Hashable = ('field', inner_key, value.operation, value.key)
+            value_filter = self._filters.get(key)
+            if value_filter is None:
+                value_filter = ValueFilter()
+                value_filter.CopyFrom(inner_filter)
+                value_filter.operation = value.operation
+                value_filter.key = value.key
+                self._filters[key] = value_filter
+
+        elif isinstance(value, (str, int, float)):
+            key = str(value)
+            value_filter = self._filters.get(key)
+            if value_filter is None:
+                value_filter = self._filters[key] = ValueFilter(simple_filter=key)
+
+        elif isinstance(value, dict):
+            fields = {k: self.to_value_filter(v) for k, v in value.items()}
+            key = ('message', frozenset((k, field_key) for k, (field_key, _) in fields.items()))
+            value_filter = self._filters.get(key)
+            if value_filter is None:
+                value_filter = self._filters[key] = ValueFilter(message_filter=MessageFilter(
+                    fields={k: field_filter for k, (_, field_filter) in fields.items()}
+                ))
+
+        elif isinstance(value, list):
+            if all(isinstance(v, str) for v in value):
+                key = ('simple_list', tuple(value))
+                value_filter = self._filters.get(key)
+                if value_filter is None:
+                    value_filter = self._filters[key] = ValueFilter(simple_list=SimpleList(simple_values=value))
+            else:
+                values = [self.to_value_filter(v) for v in value]
+                key = ('list', tuple(value_key for value_key, _ in values))
+                value_filter = self._filters.get(key)
+                if value_filter is None:
+                    value_filter = self._filters[key] = ValueFilter(list_filter=ListValueFilter(
+                        values=[list_item_filter for _, list_item_filter in values]
+                    ))
+
+        elif value is None:
+            key = None
+            value_filter = self._filters.get(key)
+            if value_filter is None:
+                value_filter = self._filters[key] = ValueFilter()
+
+        else:
+            raise TypeError(f'Cannot convert {type(value)} object to ValueFilter: {value}')
+
+        return key, value_filter
+
+
 # =========================
 # MetadataFilter
 # =========================
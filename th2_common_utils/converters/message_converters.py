@@ -12,17 +12,22 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
+from collections.abc import Mapping, Sequence as SequenceABC
 import datetime
+from itertools import chain
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+import sys
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 from google.protobuf.json_format import ParseDict
 from google.protobuf.timestamp_pb2 import Timestamp
 from th2_grpc_common.common_pb2 import (ConnectionID, Direction, EventID,
                                         ListValue, Message, MessageID, MessageMetadata, NullValue, Value)
 
-from th2_common_utils.event_components import TableComponent, TreeTableComponent
+from th2_common_utils.converters.metadata_converters import message_metadata_to_dict, message_metadata_to_record
+from th2_common_utils.event_components import TableComponent, TableLimits, TreeTableComponent
+from th2_common_utils.instrumentation import count_message_nodes, count_nodes, count_table_rows, instrumented
 
 
 DictMessageType = Union[str, List, Dict]
@@ -50,6 +55,7 @@ def _message_to_dict_convert_value(value: Value) -> Optional[DictMessageType]:
         raise TypeError(f'Expected simple_value, list_value or message_value. {type(value)} object received: {value}')
 
 
+@instrumented('message_to_dict', lambda result: (count_nodes(result['fields']) - 1, 0))
 def message_to_dict(message: Message) -> Dict[str, Optional[DictMessageType]]:
     """Converts th2-message to a dict.
     Fields of th2-message will be converted to a dict. You will lose all metadata.
@@ -64,23 +70,9 @@ def message_to_dict(message: Message) -> Dict[str, Optional[DictMessageType]]:
     Raises:
         TypeError: Occurs when 'message.fields' contains a field not of the 'Value' type.
     """
-    message_metadata = message.metadata
-
     return {
         'parent_event_id': message.parent_event_id.id,
-        'metadata': {
-            'session_alias': message_metadata.id.connection_id.session_alias,
-            'session_group': message_metadata.id.connection_id.session_group,
-            'direction': Direction.Name(message_metadata.id.direction),
-            'sequence': message_metadata.id.sequence,
-            'subsequence': list(message_metadata.id.subsequence),
-            'book_name': message_metadata.id.book_name,
-            'timestamp': message_metadata.id.timestamp.ToDatetime() if message_metadata.id.HasField('timestamp')
-            else None,
-            'message_type': message_metadata.message_type,
-            'properties': dict(**message_metadata.properties),
-            'protocol': message_metadata.protocol
-        },
+        'metadata': message_metadata_to_dict(message.metadata),
         'fields': {
             field: _message_to_dict_convert_value(field_value)
             for field, field_value in message.fields.items()
@@ -88,27 +80,126 @@ def message_to_dict(message: Message) -> Dict[str, Optional[DictMessageType]]:
     }
 
 
+def _message_to_compact_dict_convert_value(value: Value, intern_values: bool) -> Optional[DictMessageType]:
+    value_kind = value.WhichOneof('kind')
+
+    if value_kind == 'simple_value':
+        return sys.intern(value.simple_value) if intern_values else value.simple_value  # type: ignore
+
+    elif value_kind == 'list_value':
+        return [
+            _message_to_compact_dict_convert_value(list_item, intern_values) for list_item in value.list_value.values
+        ]
+
+    elif value_kind == 'message_value':
+        return {
+            sys.intern(field): _message_to_compact_dict_convert_value(field_value, intern_values)
+            for field, field_value in value.message_value.fields.items()
+        }
+
+    elif value_kind == 'null_value':
+        return None
+
+    else:
+        raise TypeError(f'Expected simple_value, list_value or message_value. {type(value)} object received: {value}')
+
+
+@instrumented('message_to_compact_dict', lambda result: (count_nodes(result['fields']) - 1, 0))
+def message_to_compact_dict(message: Message, intern_values: bool = False) -> Dict[str, Any]:
+    """Converts th2-message to a dict using less memory than `message_to_dict`.
+
+    Use it to keep many converted messages in memory. The result differs from `message_to_dict` result:
+        - field names are interned, so all messages share them;
+        - 'metadata' is a MessageMetadataRecord named tuple with interned strings
+          (`metadata._asdict()` gives the dict form, except 'subsequence' which is a tuple).
+    Args:
+        message: th2 message.
+        intern_values: If True, simple values are interned too. Useful when most of the values are
+            enumerations, flags or other often repeated strings.
+    Returns:
+        Dict with 'parent_event_id', 'metadata' and 'fields' keys.
+    Raises:
+        TypeError: Occurs when 'message.fields' contains a field not of the 'Value' type.
+    """
+    return {
+        'parent_event_id': message.parent_event_id.id,
+        'metadata': message_metadata_to_record(message.metadata),
+        'fields': {
+            sys.intern(field): _message_to_compact_dict_convert_value(field_value, intern_values)
+            for field, field_value in message.fields.items()
+        }
+    }
+
+
 def _dict_to_message_convert_value(entity: Any) -> Value:
+    if isinstance(entity, Value):
+        return entity
+
+    value = Value()
+    _dict_to_message_fill_value(value, entity)
+    return value
+
+
+def _dict_to_message_check_value(entity: Any) -> None:
+    """Raises TypeError if `_dict_to_message_fill_value` cannot convert the entity.
+
+    The fill writes to the value as it goes, so callers changing existing messages check the entity first
+    to leave the message unchanged on failure.
+    """
+
+    if isinstance(entity, list):
+        for list_item in entity:
+            _dict_to_message_check_value(list_item)
+    elif isinstance(entity, dict):
+        for field, field_value in entity.items():
+            if not isinstance(field, str):
+                raise TypeError(f'Cannot use {type(field)} object as field name.')
+            _dict_to_message_check_value(field_value)
+    elif not (entity is None or isinstance(entity, (str, int, float, Value, ListValue, Message))):
+        raise TypeError(f'Cannot convert {type(entity)} object.')
+
+
+def _dict_to_message_fill_value(value: Value, entity: Any, merge: bool = False) -> None:
+    """Writes the entity directly to the (possibly already filled) value without intermediate Value objects.
+
+    If 'merge' is True, dicts are merged into the existing message_value recursively instead of replacing it.
+    """
+
     if isinstance(entity, (str, int, float)):
-        return Value(simple_value=str(entity))
+        value.simple_value = str(entity)
+
     elif isinstance(entity, list):
-        return Value(list_value=ListValue(values=list(map(_dict_to_message_convert_value, entity))))
+        list_value = value.list_value
+        list_value.SetInParent()
+        list_values = list_value.values
+        del list_values[:]
+        for list_item in entity:
+            _dict_to_message_fill_value(list_values.add(), list_item)
+
     elif isinstance(entity, dict):
-        return Value(message_value=Message(fields={k: _dict_to_message_convert_value(v) for k, v in entity.items()}))
+        message_value = value.message_value
+        if not merge or value.WhichOneof('kind') != 'message_value':
+            message_value.Clear()
+            message_value.SetInParent()
+        fields = message_value.fields
+        for field, field_value in entity.items():
+            _dict_to_message_fill_value(fields[field], field_value, merge)
+
     elif entity is None:
-        return Value(null_value=NullValue.NULL_VALUE)
+        value.null_value = NullValue.NULL_VALUE
 
     elif isinstance(entity, Value):
-        return entity
+        value.CopyFrom(entity)
     elif isinstance(entity, ListValue):
-        return Value(list_value=entity)
+        value.list_value.CopyFrom(entity)
     elif isinstance(entity, Message):
-        return Value(message_value=entity)
+        value.message_value.CopyFrom(entity)
 
     else:
         raise TypeError(f'Cannot convert {type(entity)} object.')
 
 
+@instrumented('dict_to_message', lambda result: (count_message_nodes(result.fields.values()), result.ByteSize()))
 def dict_to_message(fields: dict,
                     parent_event_id: Optional[EventID] = None,
                     message_type: str = '',
@@ -162,9 +253,12 @@ def dict_to_message(fields: dict,
         timestamp_pb.FromDatetime(timestamp)
         metadata.id.timestamp.CopyFrom(timestamp_pb)
 
-    return Message(parent_event_id=parent_event_id,
-                   metadata=metadata,
-                   fields={field: _dict_to_message_convert_value(field_value) for field, field_value in fields.items()})
+    message = Message(parent_event_id=parent_event_id, metadata=metadata)
+    message_fields = message.fields
+    for field, field_value in fields.items():
+        _dict_to_message_fill_value(message_fields[field], field_value)
+
+    return message
 
 
 def _message_to_table_convert_value(message_value: Union[str, List, Dict],
@@ -205,7 +299,72 @@ def _message_to_table_convert_value(message_value: Union[str, List, Dict],
         raise TypeError(f'Expected object type of str, int, float, list or dict, got {type(message_value)}')
 
 
-def message_to_table(message: Union[Dict, Message], sort: bool = False) -> TreeTableComponent:
+class _BoundedTableBuilder:
+    """Builds tables within TableLimits, replacing the entries past the limits by summary rows.
+
+    Value objects are converted on the walk, so the entries past the limits are never converted.
+    """
+
+    __slots__ = ('columns_names', 'sort', 'max_rows', 'max_depth', 'remaining_cells')
+
+    def __init__(self, columns_names: List[str], sort: bool, limits: TableLimits) -> None:
+        self.columns_names = columns_names
+        self.sort = sort
+        self.max_rows = limits.max_rows
+        self.max_depth = limits.max_depth
+        self.remaining_cells = limits.max_cells
+
+    def convert(self, value: Any, depth: int) -> Union[str, TableComponent]:
+        if isinstance(value, Value):
+            value_kind = value.WhichOneof('kind')
+            if value_kind == 'message_value':
+                return self.convert_entries(value.message_value.fields, False, depth)
+            elif value_kind == 'list_value':
+                return self.convert_entries(value.list_value.values, True, depth)
+            value = _message_to_dict_convert_value(value)
+
+        if isinstance(value, str):
+            return value
+        elif isinstance(value, list):
+            return self.convert_entries(value, True, depth)
+        elif isinstance(value, dict):
+            return self.convert_entries(value, False, depth)
+        else:
+            raise TypeError(f'Expected object type of str, int, float, list or dict, got {type(value)}')
+
+    def convert_entries(self, entries: Any, is_list: bool, depth: int) -> Union[str, TableComponent]:
+        if self.max_depth is not None and depth >= self.max_depth:
+            return f'... {len(entries):,} entries' if is_list else f'... {len(entries):,} fields'
+
+        table = TableComponent(columns_names=self.columns_names, sort=self.sort)
+        self.fill(table, enumerate(entries) if is_list else entries.items(), len(entries), is_list, depth)
+        return table
+
+    def fill(self, table: Union[TableComponent, TreeTableComponent], items: Any, size: int, is_list: bool,
+             depth: int) -> None:
+        for index, (name, item) in enumerate(items):
+            if (self.max_rows is not None and index >= self.max_rows) or self.remaining_cells == 0:
+                # List rows are named by indexes, so the summary row is named by the first skipped index
+                # to keep the rows of sorted tables comparable.
+                if is_list:
+                    table.add_row(index, f'... {size - index:,} more entries')
+                else:
+                    table.add_row('...', f'{size - index:,} more fields')
+                break
+            if self.remaining_cells is not None:
+                self.remaining_cells -= 1
+
+            converted = self.convert(item, depth + 1)
+            if isinstance(converted, TableComponent):
+                table.add_table(name, converted)
+            else:
+                table.add_row(name, converted)
+
+
+@instrumented('message_to_table', lambda result: (count_table_rows(result), 0))
+def message_to_table(message: Union[Dict, Message],
+                     sort: bool = False,
+                     limits: Optional[TableLimits] = None) -> TreeTableComponent:
     """Converts th2-message or dict to a TreeTable.
     Table can have only two columns. Nested tables are allowed. You will lose 'parent_event_id' and 'metadata'
     of the message.
@@ -213,17 +372,25 @@ def message_to_table(message: Union[Dict, Message], sort: bool = False) -> TreeT
         message: th2-message.
         sort: If True, the rows will be sorted by the first field, otherwise, rows will be set in the order
             that you add it.
+        limits: Limits of the rows, nesting depth and total number of rows. Entries past the limits are replaced
+            by summary rows (see `message_to_table_pages` to get them). No limits by default.
     Returns:
         Tree table with two columns - one contains the name of the field and the other contains the value of this field.
     Raises:
         TypeError: Occurs when 'message.fields' contains a field not of the 'Value' type.
     """
 
+    table = TreeTableComponent(columns_names=['Field Value'], sort=sort)
+
+    if limits is not None:
+        fields = message.fields if isinstance(message, Message) else message
+        builder = _BoundedTableBuilder(table.columns_names, sort, limits)
+        builder.fill(table, fields.items(), len(fields), False, 0)
+        return table
+
     if isinstance(message, Message):
         message = message_to_dict(message)['fields']  # type: ignore
 
-    table = TreeTableComponent(columns_names=['Field Value'], sort=sort)
-
     for field_name in message:  # type: ignore
         table_entity = _message_to_table_convert_value(message_value=message[field_name],  # type: ignore
                                                        columns_names=table.columns_names,
@@ -236,6 +403,211 @@ def message_to_table(message: Union[Dict, Message], sort: bool = False) -> TreeT
     return table
 
 
+class _LazyConvertedSequence(SequenceABC):
+    """Sequence of protobuf list values or (field, value) pairs converted to dict values on access."""
+
+    def __init__(self, values: Sequence[Any]) -> None:
+        self.values = values
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[item_index] for item_index in range(*index.indices(len(self)))]
+        value = self.values[index]
+        if isinstance(value, tuple):
+            return value[0], _message_to_dict_convert_value(value[1])
+        return _message_to_dict_convert_value(value)
+
+
+def _table_page_items(message: Union[Dict, Message], path: str) -> Tuple[Sequence[Any], bool]:
+    """Returns (items, is_list) of the list or sub-message at the path, converted lazily to dict values."""
+
+    # field_path module imports this one, so it's imported here.
+    from th2_common_utils.field_path import compile_field_path
+
+    node: Any
+    if isinstance(message, Message):
+        node = compile_field_path(path).get(message)
+        if isinstance(node, ListValue):
+            return _LazyConvertedSequence(node.values), True
+        elif isinstance(node, Message):
+            return _LazyConvertedSequence(list(node.fields.items())), False
+    else:
+        node = message
+        for step in compile_field_path(path).steps:
+            node = node[step]  # type: ignore
+        if isinstance(node, list):
+            return node, True
+        elif isinstance(node, dict):
+            return list(node.items()), False
+
+    raise TypeError(f'Expected a list or a message at {path!r}, got {type(node)}')
+
+
+def message_to_table_pages(message: Union[Dict, Message],
+                           path: str,
+                           page_size: int,
+                           start: int = 0,
+                           sort: bool = False,
+                           limits: Optional[TableLimits] = None) -> Iterator[TreeTableComponent]:
+    """Pages a list or a sub-message of the message into tables.
+
+    Use it to publish the entries that `message_to_table` with limits replaced by a summary row as follow-up events.
+    Entries are converted only when their page is built.
+    Args:
+        message: th2-message or dict (as for `message_to_table`).
+        path: Field path of the list or the sub-message (e.g. 'Parties.PartyIDs').
+        page_size: Maximum number of entries per table.
+        start: Index of the first entry to page.
+        sort: If True, the rows of the tables will be sorted.
+        limits: Limits of every page table (e.g. for nested lists of the entries). No limits by default.
+    Returns:
+        Iterator of tree tables. Rows of a table are named by list indexes or field names.
+    Raises:
+        KeyError: Occurs when the path refers to a missing field.
+        TypeError: Occurs when the path refers to a simple value.
+        ValueError: Occurs when 'page_size' is not positive.
+    """
+
+    if page_size <= 0:
+        raise ValueError(f'page_size must be positive: {page_size}')
+
+    items, is_list = _table_page_items(message, path)
+    columns_names = ['Field Value']
+
+    for page_start in range(start, len(items), page_size):
+        table = TreeTableComponent(columns_names=columns_names, sort=sort)
+        if limits is not None and isinstance(items, _LazyConvertedSequence):
+            # The builder converts Value objects itself, skipping the entries past the limits.
+            page = items.values[page_start:page_start + page_size]
+        else:
+            page = items[page_start:page_start + page_size]
+        page_items = enumerate(page, page_start) if is_list else page
+
+        if limits is not None:
+            _BoundedTableBuilder(columns_names, sort, limits).fill(table, page_items, len(page), is_list, 0)
+        else:
+            for name, value in page_items:
+                table_entity = _message_to_table_convert_value(message_value=value,
+                                                               columns_names=columns_names,
+                                                               sort=sort)
+                if isinstance(table_entity, TableComponent):
+                    table.add_table(name, table_entity)
+                else:
+                    table.add_row(name, table_entity)
+
+        yield table
+
+
+_MISSING = object()
+
+_COMPARISON_VALUE_NODES: Dict[Optional[str], Callable[[Value], Any]] = {
+    'simple_value': lambda value: value.simple_value,
+    'message_value': lambda value: value.message_value.fields,
+    'list_value': lambda value: value.list_value.values
+}
+
+
+def _comparison_node(node: Any) -> Any:
+    """Unwraps Value and Message objects to their simple value, fields map or list values."""
+
+    if isinstance(node, Value):
+        get_node = _COMPARISON_VALUE_NODES.get(node.WhichOneof('kind'))
+        return get_node(node) if get_node is not None else None
+    elif isinstance(node, Message):
+        return node.fields
+    else:
+        return node
+
+
+def _comparison_kind(node: Any) -> Optional[str]:
+    if node is _MISSING or node is None:
+        return None
+    elif isinstance(node, str):
+        return 'simple'
+    elif isinstance(node, Mapping):
+        return 'message'
+    elif isinstance(node, SequenceABC):
+        return 'list'
+    else:
+        return 'simple'
+
+
+def _comparison_table_add(table: Union[TableComponent, TreeTableComponent],
+                          name: Union[str, int],
+                          nodes: List[Any],
+                          sort: bool) -> None:
+    kinds = [_comparison_kind(node) for node in nodes]
+
+    if 'message' not in kinds and 'list' not in kinds:
+        table.add_row(name, *('' if kind is None else str(node) for node, kind in zip(nodes, kinds)))
+        return
+
+    nested_table = TableComponent(columns_names=table.columns_names, sort=sort)
+
+    if 'simple' in kinds:
+        # The field is a simple value in some messages and a message or a list in others.
+        nested_table.add_row('(value)', *(str(node) if kind == 'simple' else '' for node, kind in zip(nodes, kinds)))
+
+    if 'message' in kinds:
+        fields = dict.fromkeys(chain.from_iterable(node for node, kind in zip(nodes, kinds) if kind == 'message'))
+        for field in fields:
+            field_nodes = [
+                _comparison_node(node[field]) if kind == 'message' and field in node else _MISSING
+                for node, kind in zip(nodes, kinds)
+            ]
+            _comparison_table_add(nested_table, field, field_nodes, sort)
+
+    if 'list' in kinds:
+        for index in range(max(len(node) for node, kind in zip(nodes, kinds) if kind == 'list')):
+            item_nodes = [
+                _comparison_node(node[index]) if kind == 'list' and index < len(node) else _MISSING
+                for node, kind in zip(nodes, kinds)
+            ]
+            _comparison_table_add(nested_table, index, item_nodes, sort)
+
+    table.add_table(name, nested_table)  # type: ignore
+
+
+@instrumented('messages_to_comparison_table', lambda result: (count_table_rows(result), 0))
+def messages_to_comparison_table(messages: Sequence[Union[Dict, Message]],
+                                 columns_names: Optional[List[str]] = None,
+                                 sort: bool = False) -> TreeTableComponent:
+    """Converts several th2-messages or dicts to one TreeTable with a column per message.
+
+    Fields of all messages are walked together, so every field name is written to the table only once. Cells of
+    the messages that don't have the field are empty.
+    Args:
+        messages: th2-messages or dicts (as for `message_to_table`).
+        columns_names: Names of the columns, one per message. 'Message 1', 'Message 2', ... by default.
+        sort: If True, the rows will be sorted by the first field, otherwise, rows will be set in the order
+            that they appear in the messages.
+    Returns:
+        Tree table with the field names and a column with the field values of every message.
+    Raises:
+        ValueError: Occurs when the number of the columns names differs from the number of the messages.
+    """
+
+    if columns_names is None:
+        columns_names = [f'Message {index}' for index in range(1, len(messages) + 1)]
+    elif len(columns_names) != len(messages):
+        raise ValueError(f'Expected {len(messages)} columns names, got {len(columns_names)}')
+
+    table = TreeTableComponent(columns_names=columns_names, sort=sort)
+    nodes = [_comparison_node(message) for message in messages]
+
+    for field in dict.fromkeys(chain.from_iterable(nodes)):
+        _comparison_table_add(table,
+                              field,
+                              [_comparison_node(node[field]) if field in node else _MISSING for node in nodes],
+                              sort)
+
+    return table
+
+
+@instrumented('json_to_message', lambda result: (count_message_nodes(result.fields.values()), result.ByteSize()))
 def json_to_message(json_path: Union[str, Path]) -> Message:
     """Read json file and convert its content to th2-message.
     Args:
@@ -0,0 +1,102 @@
+#   Copyright 2022-2022 Exactpro (Exactpro Systems Limited)
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+import datetime
+import sys
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple
+
+from th2_grpc_common.common_pb2 import Direction, MessageMetadata, RawMessageMetadata
+
+
+def message_metadata_to_dict(message_metadata: MessageMetadata) -> Dict[str, Any]:
+    """Converts th2-message metadata to a dict (as in 'metadata' of `message_to_dict` result)."""
+
+    return {
+        'session_alias': message_metadata.id.connection_id.session_alias,
+        'session_group': message_metadata.id.connection_id.session_group,
+        'direction': Direction.Name(message_metadata.id.direction),
+        'sequence': message_metadata.id.sequence,
+        'subsequence': list(message_metadata.id.subsequence),
+        'book_name': message_metadata.id.book_name,
+        'timestamp': message_metadata.id.timestamp.ToDatetime() if message_metadata.id.HasField('timestamp')
+        else None,
+        'message_type': message_metadata.message_type,
+        'properties': dict(**message_metadata.properties),
+        'protocol': message_metadata.protocol
+    }
+
+
+def raw_message_metadata_to_dict(raw_message_metadata: RawMessageMetadata) -> Dict[str, Any]:
+    """Converts raw message metadata to a dict with the same layout as `message_metadata_to_dict` result.
+
+    Raw messages have no message type, so 'message_type' is always an empty string.
+    """
+
+    return {
+        'session_alias': raw_message_metadata.id.connection_id.session_alias,
+        'session_group': raw_message_metadata.id.connection_id.session_group,
+        'direction': Direction.Name(raw_message_metadata.id.direction),
+        'sequence': raw_message_metadata.id.sequence,
+        'subsequence': list(raw_message_metadata.id.subsequence),
+        'book_name': raw_message_metadata.id.book_name,
+        'timestamp': raw_message_metadata.id.timestamp.ToDatetime() if raw_message_metadata.id.HasField('timestamp')
+        else None,
+        'message_type': '',
+        'properties': dict(**raw_message_metadata.properties),
+        'protocol': raw_message_metadata.protocol
+    }
+
+
+_EMPTY_PROPERTIES: Mapping[str, str] = MappingProxyType({})
+
+
+class MessageMetadataRecord(NamedTuple):
+    """Compact immutable form of 'metadata' of `message_to_dict` result. `_asdict()` returns the dict form."""
+
+    session_alias: str
+    session_group: str
+    direction: str
+    sequence: int
+    subsequence: Tuple[int, ...]
+    book_name: str
+    timestamp: Optional[datetime.datetime]
+    message_type: str
+    properties: Mapping[str, str]
+    protocol: str
+
+
+def message_metadata_to_record(message_metadata: MessageMetadata) -> MessageMetadataRecord:
+    """Converts th2-message metadata to a compact record.
+
+    Session, book, direction, message type and protocol strings are interned, so the records of a stream share them.
+    Empty subsequence and properties are shared too (the shared empty properties are read-only).
+    """
+
+    message_id = message_metadata.id
+    connection_id = message_id.connection_id
+    properties = message_metadata.properties
+
+    return MessageMetadataRecord(
+        sys.intern(connection_id.session_alias),
+        sys.intern(connection_id.session_group),
+        sys.intern(Direction.Name(message_id.direction)),
+        message_id.sequence,
+        tuple(message_id.subsequence),
+        sys.intern(message_id.book_name),
+        message_id.timestamp.ToDatetime() if message_id.HasField('timestamp') else None,
+        sys.intern(message_metadata.message_type),
+        dict(properties) if properties else _EMPTY_PROPERTIES,
+        sys.intern(message_metadata.protocol)
+    )
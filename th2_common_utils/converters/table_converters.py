@@ -0,0 +1,266 @@
+#   Copyright 2022-2022 Exactpro (Exactpro Systems Limited)
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""Conversion of column-oriented tables to th2-messages.
+
+A table is a mapping of column names to sequences (e.g. `read_csv_columns` result), a NumPy structured array
+or a pandas DataFrame. NumPy and pandas are not required: their objects are recognized by their attributes.
+"""
+
+import csv
+import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from google.protobuf.timestamp_pb2 import Timestamp
+from th2_grpc_common.common_pb2 import ConnectionID, Direction, EventID, Message, MessageID, MessageMetadata
+
+from th2_common_utils.field_path import compile_field_path, FieldPath
+from th2_common_utils.instrumentation import count_message_nodes, instrumented
+
+
+METADATA_COLUMNS = (
+    'session_alias', 'session_group', 'direction', 'sequence', 'book_name', 'timestamp', 'message_type', 'protocol'
+)
+
+# Plain steps (None for paths with list indexes), compiled path and string values of a field column.
+_FieldColumn = Tuple[Optional[Tuple[str, ...]], FieldPath, List[Optional[str]]]
+
+
+def read_csv_columns(path: Union[str, Path], delimiter: str = ',', encoding: str = 'utf-8') -> Dict[str, List[str]]:
+    """Reads a CSV file with a header to a column-oriented table.
+
+    Args:
+        path: Path to the CSV file.
+        delimiter: Delimiter of the values.
+        encoding: Encoding of the file.
+
+    Returns:
+        Dict of column names to lists of values.
+    """
+
+    with open(path, newline='', encoding=encoding) as csv_file:
+        reader = csv.reader(csv_file, delimiter=delimiter)
+        header = next(reader, [])
+        columns = list(zip(*reader))
+
+    return {name: list(column) for name, column in zip(header, columns)} if columns else {name: [] for name in header}
+
+
+def _get_columns(table: Any) -> Tuple[List[str], Any]:
+    """Returns column names and the function returning a column by its name."""
+
+    dtype = getattr(table, 'dtype', None)
+    if dtype is not None and dtype.names is not None:  # NumPy structured array
+        return list(dtype.names), table.__getitem__
+    elif hasattr(table, 'columns') and hasattr(table, 'iloc'):  # pandas DataFrame
+        return [str(name) for name in table.columns], table.__getitem__
+    elif isinstance(table, Mapping):
+        return list(table), table.__getitem__
+    else:
+        raise TypeError(f'Expected a mapping of columns, NumPy structured array or pandas DataFrame, got {type(table)}')
+
+
+def _is_missing(value: Any) -> bool:
+    """Checks whether the value is missing: None, NaN or NaT (NaN and NaT are not equal to themselves)."""
+
+    if value is None:
+        return True
+    try:
+        if value != value:
+            return True
+    except (TypeError, ValueError):  # e.g. arrays, whose comparison results are not booleans
+        return False
+    return False
+
+
+def _column_to_strings(column: Any) -> List[Optional[str]]:
+    """Converts column values to strings. Missing values (None, NaN, NaT) are converted to None."""
+
+    if hasattr(column, 'isna') and hasattr(column, 'astype'):  # pandas Series
+        strings = column.astype(str).tolist()
+        missing = column.isna().tolist()
+    elif hasattr(column, 'astype') and hasattr(column, 'dtype'):  # NumPy array
+        kind = column.dtype.kind
+        if kind == 'O':
+            return [None if _is_missing(value) else str(value) for value in column.tolist()]
+        strings = column.astype(str).tolist()
+        missing = (column != column).tolist() if kind in 'fcmM' else ()
+    else:
+        return [value if value.__class__ is str else None if _is_missing(value) else str(value) for value in column]
+
+    if any(missing):
+        return [None if is_missing else string for string, is_missing in zip(strings, missing)]
+    return strings
+
+
+def _column_to_list(column: Any) -> List[Any]:
+    return column.tolist() if hasattr(column, 'tolist') else list(column)
+
+
+def _set_timestamp(timestamp_pb: Timestamp, timestamp: Any) -> None:
+    if isinstance(timestamp, datetime.datetime):
+        timestamp_pb.FromDatetime(timestamp)
+    else:
+        # NumPy datetime64[ns] values become integers by tolist(), so integers are nanoseconds since the epoch.
+        timestamp_pb.FromNanoseconds(int(timestamp))
+
+
+def _measure_messages(messages: List[Message]) -> Tuple[int, int]:
+    return sum(count_message_nodes(message.fields.values()) for message in messages), 0
+
+
+def _check_field_paths(field_paths: List[FieldPath]) -> None:
+    """Raises TypeError if a field path goes through another one, e.g. 'A.B' and 'A' (a field can't be both)."""
+
+    prefixes = {}
+    for field_path in field_paths:
+        for length in range(1, len(field_path.steps)):
+            prefixes[field_path.steps[:length]] = field_path.path
+    for field_path in field_paths:
+        sub_field_path = prefixes.get(field_path.steps)
+        if sub_field_path is not None:
+            raise TypeError(f'Field paths conflict: {field_path.path!r} cannot contain {sub_field_path!r}')
+
+
+@instrumented('columns_to_messages', _measure_messages)
+def columns_to_messages(table: Any,
+                        fields: Optional[Mapping[str, str]] = None,
+                        metadata: Optional[Mapping[str, str]] = None,
+                        parent_event_id: Optional[EventID] = None,
+                        message_type: str = '',
+                        session_alias: str = '',
+                        session_group: str = '',
+                        direction: str = 'FIRST',
+                        book_name: str = '',
+                        protocol: str = '',
+                        start_sequence: int = 1) -> List[Message]:
+    """Converts a column-oriented table to th2-messages, one message per row.
+
+    Values are converted to strings column by column (with `astype(str)` for NumPy and pandas columns).
+    Missing values (None, NaN, NaT) are not added to the messages.
+
+    Args:
+        table: Mapping of column names to sequences, NumPy structured array or pandas DataFrame.
+        fields: Mapping of column names to field paths (e.g. {'party': 'Parties.PartyID'}). If not set, every column
+            that is not used in 'metadata' is converted to the top-level field with the same name.
+        metadata: Mapping of metadata parts (see METADATA_COLUMNS) to the column names they are taken from. Timestamp
+            column should contain datetime objects or integer nanoseconds since the epoch.
+        parent_event_id: Parent event id of all messages.
+        message_type: Message type (if not taken from a column).
+        session_alias: Session alias (if not taken from a column).
+        session_group: Session group (if not taken from a column).
+        direction: Direction (if not taken from a column).
+        book_name: Name of the book (if not taken from a column).
+        protocol: Protocol (if not taken from a column).
+        start_sequence: Sequence of the first message; sequences of the next ones are incremented by one.
+            Used if sequence is not taken from a column.
+
+    Returns:
+        th2-messages.
+
+    Raises:
+        KeyError: Occurs when a column is missing.
+        TypeError: Occurs when a field path goes through the field of another one (e.g. fields={'A': 'A', 'B': 'A.B'}),
+            since a field cannot be both a simple value and a message.
+        ValueError: Occurs when columns have different lengths or a metadata part is unknown.
+    """
+
+    column_names, get_column = _get_columns(table)
+    metadata = metadata or {}
+
+    unknown_parts = set(metadata).difference(METADATA_COLUMNS)
+    if unknown_parts:
+        raise ValueError(f'Unknown metadata parts: {sorted(unknown_parts)}. Expected some of {METADATA_COLUMNS}')
+    if fields is None:
+        metadata_column_names = set(metadata.values())
+        fields = {name: name for name in column_names if name not in metadata_column_names}
+
+    field_paths = {column_name: compile_field_path(path) for column_name, path in fields.items()}
+    _check_field_paths(list(field_paths.values()))
+
+    field_columns: List[_FieldColumn] = []
+    for column_name, field_path in field_paths.items():
+        # Paths without list indexes are filled by a plain walk, others are assigned by FieldPath.
+        plain_steps = field_path.steps if all(step.__class__ is str for step in field_path.steps) else None
+        field_columns.append((plain_steps, field_path, _column_to_strings(get_column(column_name))))  # type: ignore
+    metadata_columns = {part: _column_to_list(get_column(column_name)) for part, column_name in metadata.items()}
+
+    row_counts = {len(column) for _, _, column in field_columns} | {len(column) for column in metadata_columns.values()}
+    if len(row_counts) > 1:
+        raise ValueError(f'Columns have different lengths: {sorted(row_counts)}')
+    row_count = row_counts.pop() if row_counts else 0
+
+    prototype = Message(parent_event_id=parent_event_id if parent_event_id is not None else EventID(),
+                        metadata=MessageMetadata(id=MessageID(connection_id=ConnectionID(session_alias=session_alias,
+                                                                                         session_group=session_group),
+                                                              direction=getattr(Direction, direction),
+                                                              book_name=book_name),
+                                                 message_type=message_type,
+                                                 protocol=protocol))
+    prototype_bytes = prototype.SerializeToString()
+
+    messages = []
+    for row in range(row_count):
+        message = Message.FromString(prototype_bytes)
+        message_fields = message.fields
+
+        for plain_steps, field_path, strings in field_columns:
+            string = strings[row]
+            if string is None:
+                continue
+            if plain_steps is None:
+                field_path.assign(message, string)
+            elif len(plain_steps) == 1:
+                message_fields[plain_steps[0]].simple_value = string
+            else:
+                node_fields = message_fields
+                for step in plain_steps[:-1]:
+                    node_fields = node_fields[step].message_value.fields
+                node_fields[plain_steps[-1]].simple_value = string
+
+        message_id = message.metadata.id
+        message_id.sequence = start_sequence + row
+        if metadata_columns:
+            _set_metadata(message, metadata_columns, row)
+
+        messages.append(message)
+
+    return messages
+
+
+def _set_metadata(message: Message, metadata_columns: Mapping[str, Sequence[Any]], row: int) -> None:
+    message_metadata = message.metadata
+    message_id = message_metadata.id
+
+    for part, column in metadata_columns.items():
+        value = column[row]
+        if _is_missing(value):
+            continue
+        if part == 'session_alias':
+            message_id.connection_id.session_alias = str(value)
+        elif part == 'session_group':
+            message_id.connection_id.session_group = str(value)
+        elif part == 'direction':
+            message_id.direction = getattr(Direction, str(value))
+        elif part == 'sequence':
+            message_id.sequence = int(value)
+        elif part == 'book_name':
+            message_id.book_name = str(value)
+        elif part == 'timestamp':
+            _set_timestamp(message_id.timestamp, value)
+        elif part == 'message_type':
+            message_metadata.message_type = str(value)
+        elif part == 'protocol':
+            message_metadata.protocol = str(value)
@@ -0,0 +1,105 @@
+#   Copyright 2022-2022 Exactpro (Exactpro Systems Limited)
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""Decoding of serialized th2 messages to `message_to_dict` results.
+
+Messages are parsed by protobuf, so a full decode costs the same as `Message.FromString` + `message_to_dict`.
+Skipped top-level fields are parsed (in C) but not converted, which is the most of the decoding cost.
+"""
+
+from typing import Any, Collection, Dict, List, Optional
+
+from google.protobuf.message import DecodeError
+from th2_grpc_common.common_pb2 import Message, MessageGroup, MessageGroupBatch
+
+from th2_common_utils.converters.message_converters import _message_to_dict_convert_value, message_to_dict
+from th2_common_utils.converters.metadata_converters import message_metadata_to_dict
+from th2_common_utils.instrumentation import count_nodes, instrumented
+from th2_common_utils.wire_format import Buffer, WireFormatError
+
+
+DecodedMessage = Dict[str, Any]
+
+
+def _message_to_dict(message: Message, skip_fields: Optional[Collection[str]]) -> DecodedMessage:
+    if not skip_fields:
+        return message_to_dict(message)
+
+    return {
+        'parent_event_id': message.parent_event_id.id,
+        'metadata': message_metadata_to_dict(message.metadata),
+        'fields': {
+            field: _message_to_dict_convert_value(field_value)
+            for field, field_value in message.fields.items() if field not in skip_fields
+        }
+    }
+
+
+def _group_to_dicts(group: MessageGroup, skip_fields: Optional[Collection[str]]) -> List[DecodedMessage]:
+    return [
+        _message_to_dict(any_message.message, skip_fields)
+        for any_message in group.messages if any_message.WhichOneof('kind') == 'message'
+    ]
+
+
+@instrumented('decode_message', lambda result: (count_nodes(result['fields']) - 1, 0))
+def decode_message(data: Buffer, skip_fields: Optional[Collection[str]] = None) -> DecodedMessage:
+    """Decodes serialized th2-message to a dict, optionally without converting some top-level fields.
+
+    `decode_message(message.SerializeToString())` is equal to `message_to_dict(message)` and costs the same as
+    `Message.FromString` + `message_to_dict`. Skipping big fields (e.g. repeating groups) makes it faster.
+
+    Args:
+        data: Serialized th2-message (bytes, bytearray or memoryview).
+        skip_fields: Names of the top-level fields to skip. Their values are not converted.
+
+    Returns:
+        Dict with the same structure as `message_to_dict` result.
+
+    Raises:
+        WireFormatError: Occurs when the data is not a valid serialized message.
+    """
+
+    try:
+        message = Message.FromString(data)  # type: ignore
+    except DecodeError as error:
+        raise WireFormatError(f'Cannot decode th2-message: {error}') from error
+    return _message_to_dict(message, skip_fields)
+
+
+@instrumented('decode_message_group_batch',
+              lambda result: (sum(count_nodes(message['fields']) - 1 for group in result for message in group), 0))
+def decode_message_group_batch(data: Buffer,
+                               skip_fields: Optional[Collection[str]] = None) -> List[List[DecodedMessage]]:
+    """Decodes serialized MessageGroupBatch to dicts, optionally without converting some top-level fields.
+
+    Raw messages of the batch are skipped.
+
+    Args:
+        data: Serialized MessageGroupBatch (bytes, bytearray or memoryview).
+        skip_fields: Names of the top-level fields to skip in every message. Their values are not converted.
+
+    Returns:
+        Parsed messages of every group of the batch as dicts with the same structure as `message_to_dict` result.
+
+    Raises:
+        WireFormatError: Occurs when the data is not a valid serialized batch.
+    """
+
+    try:
+        batch = MessageGroupBatch.FromString(data)  # type: ignore
+    except DecodeError as error:
+        raise WireFormatError(f'Cannot decode MessageGroupBatch: {error}') from error
+
+    return [_group_to_dicts(group, skip_fields) for group in batch.groups]
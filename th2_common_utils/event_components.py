@@ -13,23 +13,63 @@
 #   limitations under the License.
 
 from itertools import zip_longest
+import threading
 from typing import Any, List, Optional, Union
 
 import orjson
 from sortedcontainers import SortedDict
 
+from th2_common_utils.instrumentation import instrumented
+from th2_common_utils.rendering import render, RenderLimits
+
 
 class MessageComponent:
 
-    def __init__(self, data: Any) -> None:
+    def __init__(self, data: Any, render_limits: Optional[RenderLimits] = None) -> None:
+        """Event body component with text data.
+
+        Args:
+            data: Any object. It's converted to a string by `str`, or by `render` if 'render_limits' is set.
+            render_limits: Limits of the text (see `render`). Parts past the limits are replaced by '...' marks.
+                The text is not limited if not set.
+
+        """
         self.type = 'message'
-        self.data = str(data)
+        self.data = str(data) if render_limits is None else render(data, render_limits)
 
     def __bytes__(self) -> bytes:
         return _create_event_body(self)
 
 
+class TableLimits:
+    """Limits of the tables built by `message_to_table`. None means no limit.
+
+    Entries past a limit are replaced by summary rows, e.g. '... 49,900 more entries'.
+
+    Args:
+        max_rows: Maximum number of rows per table (the summary row is not counted).
+        max_depth: Maximum nesting level of tables. Deeper messages and lists are replaced by rows like
+            '... 10 fields'.
+        max_cells: Maximum total number of rows in all tables.
+    """
+
+    __slots__ = ('max_rows', 'max_depth', 'max_cells')
+
+    def __init__(self,
+                 max_rows: Optional[int] = 1000,
+                 max_depth: Optional[int] = 16,
+                 max_cells: Optional[int] = 100_000) -> None:
+        self.max_rows = max_rows
+        self.max_depth = max_depth
+        self.max_cells = max_cells
+
+
 class AbstractTable:
+    """Rows can be added from several threads.
+
+    Setting a dict item is atomic, so only sorted tables (SortedDict changes its list and dict) take a lock.
+    A table should be serialized after all its rows are added.
+    """
 
     def __init__(self, table_type: str, columns_names: List[str], sort: bool):
         self.type = table_type
@@ -38,8 +78,10 @@ class AbstractTable:
 
         if sort:
             self.rows = SortedDict()
+            self._lock: Optional[threading.Lock] = threading.Lock()
         else:
             self.rows = {}
+            self._lock = None
 
     def add_row(self, row_name: Union[str, int, float], *values: Optional[Union[str, int, float]]) -> None:
         """Adds row to the table.
@@ -50,10 +92,15 @@ class AbstractTable:
 
         """
         if values:
-            self.rows[row_name] = {
+            row = {
                 'type': 'row',
                 'columns': dict(zip_longest(self.columns_names, values, fillvalue=''))
             }
+            if self._lock is None:
+                self.rows[row_name] = row
+            else:
+                with self._lock:
+                    self.rows[row_name] = row
 
     def add_table(self, table_name: Union[str, int, float], table: 'TableComponent') -> None:
         """Adds inner table.
@@ -63,7 +110,11 @@ class AbstractTable:
             table: Table itself.
 
         """
-        self.rows[table_name] = table
+        if self._lock is None:
+            self.rows[table_name] = table
+        else:
+            with self._lock:
+                self.rows[table_name] = table
 
     @property
     def __dict__(self) -> dict:
@@ -89,6 +140,7 @@ class TreeTableComponent(AbstractTable):
         return _create_event_body(self, sort=self.sort)
 
 
+@instrumented('create_event_body', lambda result: (0, len(result)))
 def _create_event_body(component: Any, sort: bool = False) -> bytes:
     if sort:
         return orjson.dumps(component,
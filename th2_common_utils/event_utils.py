@@ -12,17 +12,23 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
-from typing import Any, List, Optional, Union
+import threading
+from typing import Any, List, Optional, Tuple, Union
 import uuid
 
 from google.protobuf.timestamp_pb2 import Timestamp
-from th2_grpc_common.common_pb2 import Event, EventID, EventStatus, MessageID
+from th2_grpc_common.common_pb2 import Event, EventBatch, EventID, EventStatus, MessageID
 
 from th2_common_utils.event_components import MessageComponent, TreeTableComponent
+from th2_common_utils.instrumentation import instrumented
 
 
 common_id = str(uuid.uuid1())
 counter = 0
+_counter_lock = threading.Lock()
+
+# Events buffer of a thread of EventBatchCollector.
+_ThreadBuffer = Tuple[threading.Thread, List[Event]]
 
 
 def create_event_id(book_name: str,
@@ -39,8 +45,10 @@ def create_event_id(book_name: str,
         EventID class instance with 'id' attribute.
     """
     global counter
-    counter += 1
-    return EventID(id=f'{common_id}_{counter}',
+    with _counter_lock:
+        counter += 1
+        event_number = counter
+    return EventID(id=f'{common_id}_{event_number}',
                    book_name=book_name,
                    scope=scope,
                    start_timestamp=start_timestamp or create_timestamp()
@@ -54,6 +62,7 @@ def create_timestamp() -> Timestamp:
     return timestamp
 
 
+@instrumented('create_event', lambda result: (0, result.ByteSize()))
 def create_event(event_id: Optional[EventID] = None,
                  book_name: str = '',
                  scope: str = '',
@@ -95,3 +104,64 @@ def create_event(event_id: Optional[EventID] = None,
                    if isinstance(body, (MessageComponent, TreeTableComponent, bytes))
                    else MessageComponent(body)) if body is not None else b'',
         attached_message_ids=attached_message_ids)
+
+
+class EventBatchCollector:
+    """Collects events created by many threads to EventBatch objects.
+
+    Every thread adds events to its own buffer without waiting for other threads, `collect` moves the buffered events
+    of all threads to a batch.
+
+    Args:
+        parent_event_id: Parent event id of the batches.
+    """
+
+    def __init__(self, parent_event_id: Optional[EventID] = None) -> None:
+        self.parent_event_id = parent_event_id
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._buffers: List[_ThreadBuffer] = []
+
+    def _get_buffer(self) -> List[Event]:
+        buffer = getattr(self._local, 'events', None)
+        if buffer is None:
+            buffer = self._local.events = []
+            with self._lock:
+                self._buffers.append((threading.current_thread(), buffer))
+        return buffer
+
+    def add(self, event: Event) -> None:
+        """Adds the event to the buffer of the current thread."""
+
+        self._get_buffer().append(event)
+
+    def create_event(self, *args: Any, **kwargs: Any) -> Event:
+        """Creates an event by `create_event` with the same arguments and adds it to the current thread buffer."""
+
+        event = create_event(*args, **kwargs)
+        self._get_buffer().append(event)
+        return event
+
+    def collect(self) -> EventBatch:
+        """Moves the events added by all threads so far to a new batch.
+
+        Returns:
+            EventBatch with the events of every thread in the order they were added by that thread.
+        """
+
+        batch = EventBatch(parent_event_id=self.parent_event_id)
+        batch_events = batch.events
+
+        with self._lock:
+            for _, buffer in self._buffers:
+                # Other threads only append to their buffers, so the copied events can be deleted from the start.
+                events = buffer[:]
+                del buffer[:len(events)]
+                batch_events.extend(events)
+            self._buffers = [(thread, buffer) for thread, buffer in self._buffers if thread.is_alive() or buffer]
+
+        return batch
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(buffer) for _, buffer in self._buffers)
@@ -0,0 +1,231 @@
+#   Copyright 2022-2022 Exactpro (Exactpro Systems Limited)
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+from functools import lru_cache
+import re
+from typing import Any, Iterable, List, Mapping, Optional, Tuple, Union
+
+from th2_grpc_common.common_pb2 import ListValue, Message
+
+from th2_common_utils.converters.message_converters import _dict_to_message_check_value, \
+    _dict_to_message_fill_value
+
+
+PathStep = Union[str, int]
+FieldValue = Optional[Union[str, ListValue, Message]]
+
+_NO_DEFAULT: Any = object()
+_PATH_SYNTAX = re.compile(r'[^.\[\]]+(\[-?\d+\])*(\.[^.\[\]]+(\[-?\d+\])*)*')
+_PATH_TOKEN = re.compile(r'([^.\[\]]+)|\[(-?\d+)\]')
+
+
+def parse_field_path(path: str) -> Tuple[PathStep, ...]:
+    """Splits a field path to the field names and list indexes.
+
+    Args:
+        path: Field path, e.g. 'Parties.PartyIDs[0].PartyID'.
+
+    Returns:
+        Path steps - str for the field names and int for the list indexes, e.g. ('Parties', 'PartyIDs', 0, 'PartyID').
+
+    Raises:
+        ValueError: Occurs when the path has invalid syntax.
+    """
+
+    if _PATH_SYNTAX.fullmatch(path) is None:
+        raise ValueError(f'Invalid field path: {path!r}')
+
+    return tuple(field_name or int(index) for field_name, index in _PATH_TOKEN.findall(path))
+
+
+def format_field_path(steps: Iterable[PathStep]) -> str:
+    """Joins field names and list indexes to a field path, e.g. ('A', 0, 'B') -> 'A[0].B'."""
+
+    return ''.join(f'[{step}]' if isinstance(step, int) else f'.{step}' for step in steps).lstrip('.')
+
+
+class FieldPath:
+    """Parsed field path that can be applied to many th2-messages.
+
+    Args:
+        path: Field path, e.g. 'Parties.PartyIDs[0].PartyID'.
+
+    Raises:
+        ValueError: Occurs when the path has invalid syntax.
+    """
+
+    __slots__ = ('path', 'steps')
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.steps = parse_field_path(path)
+
+    def get(self, message: Message, default: Any = _NO_DEFAULT) -> FieldValue:
+        """Returns the value of the field.
+
+        Args:
+            message: th2-message.
+            default: Value to return if there is no such field. If it's not set, KeyError is raised.
+
+        Returns:
+            Field value. Conversion rules:
+                Value.simple_value - str
+                Value.list_value - ListValue
+                Value.message_value - Message
+                Value.null_value - None
+
+        Raises:
+            KeyError: Occurs when the message doesn't contain the field and 'default' isn't set.
+        """
+
+        node: Any = message
+        kind = 'message_value'
+
+        for step in self.steps:
+            if step.__class__ is str:
+                value = node.fields.get(step) if kind == 'message_value' else None
+            elif kind == 'list_value' and -len(node.values) <= step < len(node.values):  # type: ignore
+                value = node.values[step]
+            else:
+                value = None
+
+            if value is None:
+                if default is _NO_DEFAULT:
+                    raise KeyError(self.path)
+                return default  # type: ignore
+
+            kind = value.WhichOneof('kind')
+            node = getattr(value, kind) if kind is not None else None
+
+        return node if kind != 'null_value' else None  # type: ignore
+
+    def get_many(self, messages: Iterable[Message], default: Any = _NO_DEFAULT) -> List[FieldValue]:
+        """Returns the values of the field for every message of the batch.
+
+        Args:
+            messages: th2-messages.
+            default: Value to use for the messages without such field. If it's not set, KeyError is raised.
+
+        Returns:
+            List of the field values in the same order as 'messages' (see `FieldPath.get` for conversion rules).
+
+        Raises:
+            KeyError: Occurs when some message doesn't contain the field and 'default' isn't set.
+        """
+
+        get = self.get
+        return [get(message, default) for message in messages]
+
+    def assign(self, message: Message, value: Any, merge: bool = False) -> None:
+        """Sets the value of the field in place. Missing intermediate sub-messages are created.
+
+        Args:
+            message: th2-message to update.
+            value: New value of the field (same types as `dict_to_message` accepts for the fields).
+            merge: If True and both the value and the field are messages, the value is merged into the field
+                recursively instead of replacing it.
+
+        Raises:
+            KeyError: Occurs when the path refers to a missing list element.
+            TypeError: Occurs when the path goes through a field that is neither a message nor a list
+                or when the value is of the unsupported type.
+        """
+
+        _dict_to_message_check_value(value)
+
+        node: Any = message
+        steps = self.steps
+        last_step = len(steps) - 1
+        # Entries created for the missing fields are removed if the assignment fails, so the message is unchanged.
+        created_entries: List[Tuple[Any, str]] = []
+
+        try:
+            for step_index, step in enumerate(steps):
+                if step.__class__ is str:
+                    if not isinstance(node, Message):
+                        raise TypeError(f'Cannot access field {step!r} of {format_field_path(steps[:step_index])!r}')
+                    value_item = node.fields.get(step)
+                    if value_item is None:
+                        if step_index != last_step and steps[step_index + 1].__class__ is not str:
+                            raise KeyError(self.path)
+                        value_item = node.fields[step]
+                        created_entries.append((node.fields, step))  # type: ignore
+                else:
+                    if not isinstance(node, ListValue):
+                        raise TypeError(f'Cannot access element {step} of {format_field_path(steps[:step_index])!r}')
+                    if not -len(node.values) <= step < len(node.values):  # type: ignore
+                        raise KeyError(self.path)
+                    value_item = node.values[step]  # type: ignore
+
+                if step_index == last_step:
+                    _dict_to_message_fill_value(value_item, value, merge)
+                else:
+                    kind = value_item.WhichOneof('kind')
+                    node = getattr(value_item, kind) if kind is not None else value_item.message_value
+        except (KeyError, TypeError):
+            for fields, field in reversed(created_entries):
+                del fields[field]
+            raise
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.path!r})'
+
+
+@lru_cache(maxsize=1024)
+def compile_field_path(path: str) -> FieldPath:
+    """Returns FieldPath for the path. Compiled paths are cached, so the path is parsed only once."""
+
+    return FieldPath(path)
+
+
+def get_field(message: Message, path: str, default: Any = _NO_DEFAULT) -> FieldValue:
+    """Returns the value of the field located by the path, e.g. 'Parties.PartyIDs[0].PartyID'.
+
+    See `FieldPath.get` for details.
+    """
+
+    return compile_field_path(path).get(message, default)
+
+
+def get_field_values(messages: Iterable[Message], path: str, default: Any = _NO_DEFAULT) -> List[FieldValue]:
+    """Returns the values of the field located by the path for every message of the batch.
+
+    See `FieldPath.get_many` for details.
+    """
+
+    return compile_field_path(path).get_many(messages, default)
+
+
+def set_field(message: Message, path: str, value: Any) -> None:
+    """Sets the value of the field located by the path in place, e.g. set_field(msg, 'Instrument.Symbol', 'ABC').
+
+    See `FieldPath.assign` for details.
+    """
+
+    compile_field_path(path).assign(message, value)
+
+
+def update_fields(message: Message, fields: Mapping[str, Any], merge: bool = False) -> None:
+    """Sets many fields of the message in place. Keys of 'fields' are field paths.
+
+    Args:
+        message: th2-message to update.
+        fields: Field paths with the new values, e.g. {'Price': 10, 'Parties.PartyIDs[0].PartyID': 'ABC'}.
+        merge: Whether to merge dicts into existing sub-messages instead of replacing them (see `FieldPath.assign`).
+
+    Fields are set one by one, like dict.update: if setting one fails, the preceding ones stay set.
+    """
+
+    for path, value in fields.items():
+        compile_field_path(path).assign(message, value, merge)
@@ -0,0 +1,118 @@
+#   Copyright 2022-2022 Exactpro (Exactpro Systems Limited)
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+from collections import OrderedDict
+from hashlib import blake2b
+import os
+from pathlib import Path
+import struct
+import tempfile
+from typing import Optional, Tuple, Union
+
+from th2_grpc_common.common_pb2 import Message
+
+from th2_common_utils.converters.message_converters import json_to_message
+
+
+# Header of the stored files: modification time and size of the JSON file the message was loaded from.
+_STORED_HEADER = struct.Struct('<qq')
+
+
+class FixtureCache:
+    """Cache of th2-messages loaded from JSON files (see `json_to_message`).
+
+    Messages are stored as serialized protobuf bytes keyed by the file path, modification time and size,
+    so a changed file is parsed again. The last 'max_size' messages are kept in memory; if 'cache_dir' is set,
+    messages are also stored there, so other processes (e.g. test workers) don't parse the JSON files again.
+    The directory has one file per JSON file, which is replaced when the JSON file changes.
+
+    Args:
+        max_size: Number of messages to keep in memory. The least recently used ones are dropped first.
+        cache_dir: Directory of the on-disk store. It's created if it doesn't exist. No on-disk store if not set.
+    """
+
+    def __init__(self, max_size: int = 256, cache_dir: Optional[Union[str, Path]] = None) -> None:
+        if max_size <= 0:
+            raise ValueError(f'max_size must be positive: {max_size}')
+
+        self.max_size = max_size
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._entries: 'OrderedDict[Tuple[str, int, int], bytes]' = OrderedDict()
+
+    def load(self, json_path: Union[str, Path]) -> Message:
+        """Loads th2-message from the JSON file.
+
+        Args:
+            json_path: Path to json file.
+
+        Returns:
+            New th2-message object, so it can be changed without affecting the cache.
+        """
+
+        path = os.path.abspath(json_path)
+        stat = os.stat(path)
+        key = (path, stat.st_mtime_ns, stat.st_size)
+
+        message_bytes = self._entries.get(key)
+        if message_bytes is not None:
+            self._entries.move_to_end(key)
+        else:
+            message_bytes = self._load_stored(key) if self.cache_dir is not None else None
+            if message_bytes is None:
+                message_bytes = json_to_message(path).SerializeToString()
+                if self.cache_dir is not None:
+                    self._store(key, message_bytes)
+
+            self._entries[key] = message_bytes
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+        return Message.FromString(message_bytes)
+
+    def _stored_path(self, path: str) -> Path:
+        digest = blake2b(path.encode(), digest_size=16).hexdigest()
+        return self.cache_dir / f'{digest}.pb'  # type: ignore
+
+    def _load_stored(self, key: Tuple[str, int, int]) -> Optional[bytes]:
+        path, modification_time, size = key
+        try:
+            with open(self._stored_path(path), 'rb') as stored_file:
+                if stored_file.read(_STORED_HEADER.size) != _STORED_HEADER.pack(modification_time, size):
+                    return None  # stored for another version of the file
+                return stored_file.read()
+        except FileNotFoundError:
+            return None
+
+    def _store(self, key: Tuple[str, int, int], message_bytes: bytes) -> None:
+        path, modification_time, size = key
+        # The file is written under a temporary name and renamed, so other processes never read a partial file.
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(file_descriptor, 'wb') as temp_file:
+                temp_file.write(_STORED_HEADER.pack(modification_time, size))
+                temp_file.write(message_bytes)
+            os.replace(temp_path, self._stored_path(path))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def clear(self) -> None:
+        """Clears the in-memory cache. The on-disk store is kept."""
+
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
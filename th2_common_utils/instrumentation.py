@@ -0,0 +1,209 @@
+#   Copyright 2022-2022 Exactpro (Exactpro Systems Limited)
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""Opt-in metrics of the library hot paths.
+
+Instrumentation is disabled by default: instrumented functions then only check a flag. After
+`enable_instrumentation()` every call of an instrumented function updates its metrics:
+    calls - number of calls;
+    seconds - total time spent (including nested instrumented calls);
+    nodes - number of converted entities (fields, list elements, table rows, filters);
+    bytes - size of the produced bytes or of the serialized protobuf object that was produced or converted.
+
+Nodes and bytes are measured by walking the result again, which can cost as much as the call itself,
+so they are collected only after `enable_instrumentation(measure_sizes=True)` and are 0 otherwise.
+"""
+
+from functools import wraps
+import threading
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+F = TypeVar('F', bound=Callable[..., Any])
+Measure = Callable[[Any], Tuple[int, int]]
+MetricsCallback = Callable[[str, float, int, int], None]
+
+METRIC_NAMES = ('calls', 'seconds', 'nodes', 'bytes')
+
+_enabled = False
+_measure_sizes = False
+_lock = threading.Lock()
+_metrics: Dict[str, List[float]] = {}
+_callbacks: List[MetricsCallback] = []
+
+
+def enable_instrumentation(measure_sizes: bool = False) -> None:
+    """Starts collecting metrics of the instrumented functions.
+
+    Args:
+        measure_sizes: Whether to collect the nodes and bytes metrics. It makes instrumented calls noticeably
+            slower (e.g. about 2x for `dict_to_message`).
+    """
+
+    global _enabled, _measure_sizes
+    _enabled = True
+    _measure_sizes = measure_sizes
+
+
+def disable_instrumentation() -> None:
+    """Stops collecting metrics. Already collected metrics are kept."""
+
+    global _enabled
+    _enabled = False
+
+
+def is_instrumentation_enabled() -> bool:
+    return _enabled
+
+
+def reset_metrics() -> None:
+    with _lock:
+        _metrics.clear()
+
+
+def get_metrics() -> Dict[str, Dict[str, float]]:
+    """Returns a snapshot of the collected metrics.
+
+    Returns:
+        Metrics of every called function, e.g. {'message_to_dict': {'calls': 2, 'seconds': 0.01, ...}}.
+    """
+
+    with _lock:
+        return {api: dict(zip(METRIC_NAMES, values)) for api, values in _metrics.items()}
+
+
+def add_metrics_callback(callback: MetricsCallback) -> None:
+    """Adds a function that is called after every instrumented call with (api, seconds, nodes, bytes) arguments."""
+
+    _callbacks.append(callback)
+
+
+def remove_metrics_callback(callback: MetricsCallback) -> None:
+    _callbacks.remove(callback)
+
+
+_PROMETHEUS_COUNTERS = (
+    ('calls', 'Number of calls'),
+    ('seconds', 'Time spent in seconds'),
+    ('nodes', 'Number of converted entities'),
+    ('bytes', 'Number of produced or converted bytes'),
+)
+
+
+def metrics_to_prometheus(prefix: str = 'th2_common_utils') -> str:
+    """Returns the collected metrics in Prometheus text exposition format."""
+
+    metrics = get_metrics()
+    lines = []
+
+    for metric_name, description in _PROMETHEUS_COUNTERS:
+        full_name = f'{prefix}_{metric_name}_total'
+        lines.append(f'# HELP {full_name} {description}.')
+        lines.append(f'# TYPE {full_name} counter')
+        for api, api_metrics in sorted(metrics.items()):
+            lines.append(f'{full_name}{{api="{api}"}} {api_metrics[metric_name]:g}')
+
+    return '\n'.join(lines) + '\n'
+
+
+def instrumented(api: str, measure: Optional[Measure] = None) -> Callable[[F], F]:
+    """Decorator collecting metrics of the function when instrumentation is enabled.
+
+    Args:
+        api: Name of the function in the metrics.
+        measure: Function returning (nodes, bytes) for the result of the call. It's called only when
+            instrumentation is enabled with 'measure_sizes'.
+    """
+
+    def decorator(function: F) -> F:
+
+        @wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _enabled:
+                return function(*args, **kwargs)
+
+            start = perf_counter()
+            result = function(*args, **kwargs)
+            elapsed = perf_counter() - start
+
+            nodes, size = measure(result) if _measure_sizes and measure is not None else (0, 0)
+            _record(api, elapsed, nodes, size)
+            return result
+
+        return wrapper  # type: ignore
+
+    return decorator
+
+
+def _record(api: str, elapsed: float, nodes: int, size: int) -> None:
+    with _lock:
+        values = _metrics.get(api)
+        if values is None:
+            values = _metrics[api] = [0, 0.0, 0, 0]
+        values[0] += 1
+        values[1] += elapsed
+        values[2] += nodes
+        values[3] += size
+
+    for callback in _callbacks:
+        callback(api, elapsed, nodes, size)
+
+
+def count_nodes(obj: Any) -> int:
+    """Counts values of a nested structure of dicts and lists (e.g. 'fields' of `message_to_dict` result)."""
+
+    if isinstance(obj, dict):
+        return sum(map(count_nodes, obj.values())) + 1
+    elif isinstance(obj, list):
+        return sum(map(count_nodes, obj)) + 1
+    else:
+        return 1
+
+
+def count_message_nodes(values: Iterable[Any]) -> int:
+    """Counts Value objects including nested ones, e.g. count_message_nodes(message.fields.values())."""
+
+    return sum(map(_count_message_node, values))
+
+
+def _count_message_node(value: Any) -> int:
+    value_kind = value.WhichOneof('kind')
+    if value_kind == 'message_value':
+        return count_message_nodes(value.message_value.fields.values()) + 1
+    elif value_kind == 'list_value':
+        return count_message_nodes(value.list_value.values) + 1
+    else:
+        return 1
+
+
+def count_filter_nodes(value_filters: Iterable[Any]) -> int:
+    """Counts ValueFilter objects including nested ones, e.g. count_filter_nodes(message_filter.fields.values())."""
+
+    return sum(map(_count_filter_node, value_filters))
+
+
+def _count_filter_node(value_filter: Any) -> int:
+    filter_kind = value_filter.WhichOneof('kind')
+    if filter_kind == 'message_filter':
+        return count_filter_nodes(value_filter.message_filter.fields.values()) + 1
+    elif filter_kind == 'list_filter':
+        return count_filter_nodes(value_filter.list_filter.values) + 1
+    else:
+        return 1
+
+
+def count_table_rows(table: Any) -> int:
+    """Counts rows of a TableComponent/TreeTableComponent including rows of nested tables."""
+
+    return sum(count_table_rows(row) + 1 if hasattr(row, 'rows') else 1 for row in table.rows.values())
@@ -0,0 +1,188 @@
+#   Copyright 2022-2022 Exactpro (Exactpro Systems Limited)
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from th2_grpc_common.common_pb2 import EventID, Message, MessageGroupBatch, RawMessage, RawMessageMetadata
+
+from th2_common_utils.converters.metadata_converters import raw_message_metadata_to_dict
+from th2_common_utils.wire_format import ANY_MESSAGE_RAW_MESSAGE, BATCH_GROUPS, Buffer, GROUP_MESSAGES, \
+    RAW_MESSAGE_BODY, RAW_MESSAGE_METADATA, RAW_MESSAGE_PARENT_EVENT_ID, read_length, read_tag, skip_field, \
+    WireFormatError
+
+AnyMessageType = Union[Message, RawMessage]
+
+
+def iter_batch_messages(batch: MessageGroupBatch) -> Iterator[Tuple[int, AnyMessageType]]:
+    """Walks all groups of the batch.
+
+    Args:
+        batch: Batch with parsed and/or raw messages.
+
+    Returns:
+        Iterator of (group index, message) pairs, where message is either Message or RawMessage.
+    """
+
+    for group_index, group in enumerate(batch.groups):
+        for any_message in group.messages:
+            if any_message.WhichOneof('kind') == 'raw_message':
+                yield group_index, any_message.raw_message
+            else:
+                yield group_index, any_message.message
+
+
+def raw_message_body(raw_message: RawMessage) -> memoryview:
+    """Returns the body of the raw message as a memoryview.
+
+    Protobuf copies the body on every access of `raw_message.body`, so the body is copied once here; only slicing
+    the result doesn't copy it again. Use `iter_raw_messages` to read bodies of a serialized batch without copying.
+    """
+
+    return memoryview(raw_message.body)
+
+
+class RawMessageView:
+    """Raw message of a serialized MessageGroupBatch. Its parts are memoryviews of the batch buffer.
+
+    Attributes:
+        group_index: Index of the message group in the batch.
+        body: Message body (a memoryview of the batch buffer, not a copy).
+    """
+
+    __slots__ = ('group_index', 'body', '_metadata_view', '_parent_event_id_view', '_metadata')
+
+    def __init__(self, group_index: int, body: memoryview, metadata_view: memoryview,
+                 parent_event_id_view: memoryview) -> None:
+        self.group_index = group_index
+        self.body = body
+        self._metadata_view = metadata_view
+        self._parent_event_id_view = parent_event_id_view
+        self._metadata: Optional[RawMessageMetadata] = None
+
+    @property
+    def metadata(self) -> RawMessageMetadata:
+        """Metadata of the message. It's parsed on the first access."""
+
+        if self._metadata is None:
+            self._metadata = RawMessageMetadata.FromString(self._metadata_view)  # type: ignore
+        return self._metadata
+
+    @property
+    def parent_event_id(self) -> EventID:
+        return EventID.FromString(self._parent_event_id_view)  # type: ignore
+
+    def metadata_to_dict(self) -> Dict[str, Any]:
+        """Converts the metadata to a dict with the same layout as 'metadata' of `message_to_dict` result."""
+
+        return raw_message_metadata_to_dict(self.metadata)
+
+    def to_raw_message(self) -> RawMessage:
+        """Creates RawMessage object. The body is copied."""
+
+        return RawMessage(metadata=self.metadata, body=bytes(self.body), parent_event_id=self.parent_event_id)
+
+
+def iter_raw_messages(data: Buffer) -> Iterator[RawMessageView]:
+    """Walks raw messages of a serialized MessageGroupBatch without parsing it.
+
+    Parsed messages of the batch are skipped without decoding (use `decode_message_group_batch` for them).
+
+    Args:
+        data: Serialized MessageGroupBatch. It must not be changed while the views are used.
+
+    Returns:
+        Iterator of the raw messages as RawMessageView objects referencing the data.
+
+    Raises:
+        WireFormatError: Occurs when the data is not a valid serialized batch.
+    """
+
+    buffer = data if isinstance(data, memoryview) else memoryview(data)
+    empty = buffer[0:0]
+    position, end = 0, len(buffer)
+    group_index = -1
+
+    try:
+        while position < end:
+            tag, position = read_tag(buffer, position)
+            if tag != BATCH_GROUPS:
+                position = skip_field(buffer, tag, position, end)
+                continue
+
+            group_index += 1
+            group_start, position = read_length(buffer, position, end)
+            while group_start < position:
+                tag, group_start = read_tag(buffer, group_start)
+                if tag != GROUP_MESSAGES:
+                    group_start = skip_field(buffer, tag, group_start, position)
+                    continue
+
+                any_start, group_start = read_length(buffer, group_start, position)
+                while any_start < group_start:
+                    tag, any_start = read_tag(buffer, any_start)
+                    if tag != ANY_MESSAGE_RAW_MESSAGE:
+                        any_start = skip_field(buffer, tag, any_start, group_start)
+                        continue
+
+                    raw_start, any_start = read_length(buffer, any_start, group_start)
+                    body = metadata = parent_event_id = empty
+                    while raw_start < any_start:
+                        tag, raw_start = read_tag(buffer, raw_start)
+                        if tag == RAW_MESSAGE_BODY:
+                            part_start, raw_start = read_length(buffer, raw_start, any_start)
+                            body = buffer[part_start:raw_start]
+                        elif tag == RAW_MESSAGE_METADATA:
+                            part_start, raw_start = read_length(buffer, raw_start, any_start)
+                            metadata = buffer[part_start:raw_start]
+                        elif tag == RAW_MESSAGE_PARENT_EVENT_ID:
+                            part_start, raw_start = read_length(buffer, raw_start, any_start)
+                            parent_event_id = buffer[part_start:raw_start]
+                        else:
+                            raw_start = skip_field(buffer, tag, raw_start, any_start)
+
+                    yield RawMessageView(group_index, body, metadata, parent_event_id)
+    except IndexError as error:
+        raise WireFormatError(f'Cannot decode MessageGroupBatch: {error}') from error
+
+
+def build_message_group_batch(messages: Iterable[AnyMessageType], group_size: int = 1) -> MessageGroupBatch:
+    """Builds MessageGroupBatch from parsed and/or raw messages.
+
+    Args:
+        messages: Messages in the order they should be placed into the batch.
+        group_size: Number of messages per group. The last group can be smaller.
+
+    Returns:
+        MessageGroupBatch with the copies of the messages.
+
+    Raises:
+        ValueError: Occurs when 'group_size' is not positive.
+    """
+
+    if group_size <= 0:
+        raise ValueError(f'group_size must be positive: {group_size}')
+
+    batch = MessageGroupBatch()
+    add_group = batch.groups.add
+    group_messages: Any = None
+
+    for index, message in enumerate(messages):
+        if index % group_size == 0:
+            group_messages = add_group().messages
+        if isinstance(message, RawMessage):
+            group_messages.add().raw_message.CopyFrom(message)
+        else:
+            group_messages.add().message.CopyFrom(message)
+
+    return batch
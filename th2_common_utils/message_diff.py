@@ -0,0 +1,162 @@
+#   Copyright 2022-2022 Exactpro (Exactpro Systems Limited)
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+from itertools import islice
+from typing import Any, Collection, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from th2_grpc_common.common_pb2 import Message, Value
+
+from th2_common_utils.converters.message_converters import _message_to_dict_convert_value
+from th2_common_utils.field_path import format_field_path, PathStep
+
+
+class _Missing:
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return '<missing>'
+
+
+MISSING: Any = _Missing()
+
+
+class FieldDiff:
+    """Mismatch of a field of two messages.
+
+    Attributes:
+        path: Field path, e.g. 'Parties.PartyIDs[0].PartyID'.
+        expected: Expected value converted as in `message_to_dict` or MISSING if there is no such field.
+        actual: Actual value converted as in `message_to_dict` or MISSING if there is no such field.
+    """
+
+    __slots__ = ('path', 'expected', 'actual')
+
+    def __init__(self, path: str, expected: Any, actual: Any) -> None:
+        self.path = path
+        self.expected = expected
+        self.actual = actual
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FieldDiff):
+            return NotImplemented
+        return (self.path, self.expected, self.actual) == (other.path, other.expected, other.actual)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.path!r}, expected={self.expected!r}, actual={self.actual!r})'
+
+
+def diff_messages(expected: Message,
+                  actual: Message,
+                  ignore_fields: Optional[Collection[str]] = None,
+                  max_diffs: Optional[int] = None) -> List[FieldDiff]:
+    """Compares fields of two th2-messages. Metadata is not compared.
+
+    Equal sub-messages and lists are skipped by comparing their serialized bytes, so only mismatching
+    branches are walked field by field. Lists are compared element by element (order matters).
+
+    Args:
+        expected: Expected th2-message.
+        actual: Actual th2-message.
+        ignore_fields: Names of the fields to skip on any nesting level (as in `dict_to_root_message_filter`).
+        max_diffs: Stop comparison after this number of mismatches.
+
+    Returns:
+        List of mismatching fields with their values. The order of fields within a message is not defined.
+    """
+
+    diffs = _iter_fields_diffs((), expected.fields, actual.fields, frozenset(ignore_fields or ()))
+    return list(islice(diffs, max_diffs))
+
+
+def messages_equal(expected: Message, actual: Message, ignore_fields: Optional[Collection[str]] = None) -> bool:
+    """Checks whether fields of two th2-messages are equal. Comparison stops on the first mismatch.
+
+    See `diff_messages` for details.
+    """
+
+    diffs = _iter_fields_diffs((), expected.fields, actual.fields, frozenset(ignore_fields or ()))
+    return next(diffs, None) is None
+
+
+def _iter_fields_diffs(path: Tuple[PathStep, ...],
+                       expected_fields: Mapping[str, Value],
+                       actual_fields: Mapping[str, Value],
+                       ignore_fields: Collection[str]) -> Iterator[FieldDiff]:
+    for field, expected_value in expected_fields.items():
+        if field in ignore_fields:
+            continue
+        actual_value = actual_fields.get(field)
+        if actual_value is None:
+            yield FieldDiff(format_field_path(path + (field,)), _message_to_dict_convert_value(expected_value), MISSING)
+        else:
+            yield from _iter_value_diffs(path + (field,), expected_value, actual_value, ignore_fields)
+
+    for field, actual_value in actual_fields.items():
+        if field not in ignore_fields and field not in expected_fields:
+            yield FieldDiff(format_field_path(path + (field,)), MISSING, _message_to_dict_convert_value(actual_value))
+
+
+def _iter_value_diffs(path: Tuple[PathStep, ...],
+                      expected_value: Value,
+                      actual_value: Value,
+                      ignore_fields: Collection[str]) -> Iterator[FieldDiff]:
+    value_kind = expected_value.WhichOneof('kind')
+
+    if value_kind == actual_value.WhichOneof('kind'):
+        if value_kind == 'simple_value':
+            if expected_value.simple_value == actual_value.simple_value:
+                return
+
+        elif value_kind == 'message_value':
+            if not _serialized_equal(expected_value, actual_value):
+                yield from _iter_fields_diffs(path,
+                                              expected_value.message_value.fields,
+                                              actual_value.message_value.fields,
+                                              ignore_fields)
+            return
+
+        elif value_kind == 'list_value':
+            if not _serialized_equal(expected_value, actual_value):
+                yield from _iter_list_diffs(path,
+                                            expected_value.list_value.values,
+                                            actual_value.list_value.values,
+                                            ignore_fields)
+            return
+
+        else:
+            return
+
+    yield FieldDiff(format_field_path(path),
+                    _message_to_dict_convert_value(expected_value),
+                    _message_to_dict_convert_value(actual_value))
+
+
+def _iter_list_diffs(path: Tuple[PathStep, ...],
+                     expected_values: Sequence[Value],
+                     actual_values: Sequence[Value],
+                     ignore_fields: Collection[str]) -> Iterator[FieldDiff]:
+    for index in range(max(len(expected_values), len(actual_values))):
+        item_path = path + (index,)
+        if index >= len(actual_values):
+            expected = _message_to_dict_convert_value(expected_values[index])
+            yield FieldDiff(format_field_path(item_path), expected, MISSING)
+        elif index >= len(expected_values):
+            actual = _message_to_dict_convert_value(actual_values[index])
+            yield FieldDiff(format_field_path(item_path), MISSING, actual)
+        else:
+            yield from _iter_value_diffs(item_path, expected_values[index], actual_values[index], ignore_fields)
+
+
+def _serialized_equal(expected_value: Value, actual_value: Value) -> bool:
+    return expected_value.SerializeToString(deterministic=True) == actual_value.SerializeToString(deterministic=True)
@@ -0,0 +1,176 @@
+#   Copyright 2022-2022 Exactpro (Exactpro Systems Limited)
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+import time
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from th2_grpc_common.common_pb2 import ConnectionID, Direction, EventID, Message, MessageGroupBatch, MessageID, \
+    MessageMetadata
+
+from th2_common_utils.converters.message_converters import _dict_to_message_fill_value
+
+
+class MessageFactory:
+    """Creates th2-messages of one session with sequences and timestamps assigned automatically.
+
+    Metadata is built once per message type and copied to every message as serialized bytes.
+
+    Args:
+        session_alias: Session alias.
+        session_group: Session group.
+        book_name: Name of the book.
+        direction: Direction ('FIRST' or 'SECOND').
+        protocol: Protocol.
+        parent_event_id: Parent event id of all messages.
+        start_sequence: Sequence of the first message; sequences of the next ones are incremented by one.
+
+    Attributes:
+        next_sequence: Sequence of the next message.
+    """
+
+    def __init__(self,
+                 session_alias: str,
+                 session_group: str = '',
+                 book_name: str = '',
+                 direction: str = 'FIRST',
+                 protocol: str = '',
+                 parent_event_id: Optional[EventID] = None,
+                 start_sequence: int = 1) -> None:
+        self.next_sequence = start_sequence
+        self._prototype = Message(parent_event_id=parent_event_id if parent_event_id is not None else EventID(),
+                                  metadata=MessageMetadata(
+                                      id=MessageID(connection_id=ConnectionID(session_alias=session_alias,
+                                                                              session_group=session_group),
+                                                   direction=getattr(Direction, direction),
+                                                   book_name=book_name),
+                                      protocol=protocol))
+        self._prototype_bytes: Dict[str, bytes] = {}
+
+    def _get_prototype_bytes(self, message_type: str) -> bytes:
+        prototype_bytes = self._prototype_bytes.get(message_type)
+        if prototype_bytes is None:
+            self._prototype.metadata.message_type = message_type
+            prototype_bytes = self._prototype.SerializeToString()
+            self._prototype_bytes[message_type] = prototype_bytes
+        return prototype_bytes
+
+    def _fill(self, message: Message, fields: Mapping[str, Any], timestamp_ns: int,
+              properties: Optional[Mapping[str, str]]) -> None:
+        message_fields = message.fields
+        for field, field_value in fields.items():
+            _dict_to_message_fill_value(message_fields[field], field_value)
+
+        # The sequence is taken only after the fields are converted, so a failed message doesn't use it up.
+        message_id = message.metadata.id
+        message_id.sequence = self.next_sequence
+        self.next_sequence += 1
+
+        timestamp = message_id.timestamp
+        timestamp.seconds, timestamp.nanos = divmod(timestamp_ns, 1_000_000_000)
+        if properties:
+            message.metadata.properties.update(properties)
+
+    def message(self,
+                fields: Mapping[str, Any],
+                message_type: str = '',
+                properties: Optional[Mapping[str, str]] = None,
+                timestamp_ns: Optional[int] = None) -> Message:
+        """Creates th2-message with the next sequence.
+
+        Args:
+            fields: Message fields (converted as by `dict_to_message`).
+            message_type: Message type.
+            properties: Metadata properties.
+            timestamp_ns: Timestamp as nanoseconds since the epoch. Current time (`time.time_ns()`) if not set.
+
+        Returns:
+            th2-message.
+
+        Raises:
+            TypeError: Occurs when 'fields' contains a field of the unsupported type.
+        """
+
+        message = Message.FromString(self._get_prototype_bytes(message_type))
+        self._fill(message, fields, timestamp_ns if timestamp_ns is not None else time.time_ns(), properties)
+        return message
+
+    def messages(self,
+                 fields: Iterable[Mapping[str, Any]],
+                 message_type: str = '',
+                 properties: Optional[Mapping[str, str]] = None) -> List[Message]:
+        """Creates th2-messages with consecutive sequences and the current time as timestamps.
+
+        Args:
+            fields: Fields of the messages, one mapping per message.
+            message_type: Message type of all messages.
+            properties: Metadata properties of all messages.
+
+        Returns:
+            th2-messages.
+
+        Raises:
+            TypeError: Occurs when 'fields' contains a field of the unsupported type.
+        """
+
+        prototype_bytes = self._get_prototype_bytes(message_type)
+        from_string = Message.FromString
+        fill = self._fill
+
+        messages = []
+        for message_fields in fields:
+            message = from_string(prototype_bytes)
+            fill(message, message_fields, time.time_ns(), properties)
+            messages.append(message)
+        return messages
+
+    def batch(self,
+              fields: Iterable[Mapping[str, Any]],
+              message_type: str = '',
+              group_size: int = 1,
+              properties: Optional[Mapping[str, str]] = None) -> MessageGroupBatch:
+        """Creates MessageGroupBatch of th2-messages with consecutive sequences and the current time as timestamps.
+
+        Messages are built in place in the batch, so they are not copied.
+
+        Args:
+            fields: Fields of the messages, one mapping per message.
+            message_type: Message type of all messages.
+            group_size: Number of messages per group. The last group can be smaller.
+            properties: Metadata properties of all messages.
+
+        Returns:
+            MessageGroupBatch.
+
+        Raises:
+            TypeError: Occurs when 'fields' contains a field of the unsupported type.
+            ValueError: Occurs when 'group_size' is not positive.
+        """
+
+        if group_size <= 0:
+            raise ValueError(f'group_size must be positive: {group_size}')
+
+        prototype_bytes = self._get_prototype_bytes(message_type)
+        fill = self._fill
+        batch = MessageGroupBatch()
+        add_group = batch.groups.add
+        group_messages: Any = None
+
+        for index, message_fields in enumerate(fields):
+            if index % group_size == 0:
+                group_messages = add_group().messages
+            message = group_messages.add().message
+            message.MergeFromString(prototype_bytes)
+            fill(message, message_fields, time.time_ns(), properties)
+
+        return batch
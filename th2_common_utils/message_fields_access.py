@@ -12,12 +12,13 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
-from pprint import pformat
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Mapping, Optional, Union
 
 from th2_grpc_common.common_pb2 import ListValue, Message, Value
 
-from th2_common_utils.converters.message_converters import _dict_to_message_convert_value, message_to_dict
+from th2_common_utils.converters.message_converters import _dict_to_message_check_value, \
+    _dict_to_message_fill_value
+from th2_common_utils.rendering import render
 
 
 SimpleType = Union[str, int, float]
@@ -31,9 +32,6 @@ def value_get(self: Value, item: SimpleType) -> Union[str, ListValue, Message]:
     return getattr(self, self.WhichOneof('kind'))  # type: ignore
 
 
-setattr(Value, '__get__', value_get)
-
-
 # =========================
 # ListValue
 # =========================
@@ -47,10 +45,6 @@ def listvalue_len(self: ListValue) -> int:
     return len(self.values)
 
 
-setattr(ListValue, '__getitem__', listvalue_getitem)
-setattr(ListValue, '__len__', listvalue_len)
-
-
 # =========================
 # Message
 # =========================
@@ -62,24 +56,47 @@ def message_setitem(self: Message, key: str, value: Any) -> None:
     elif isinstance(value, Value):
         self.fields[key].simple_value = value.simple_value
 
-    elif isinstance(value, (list, ListValue)):
-        th2_value = _dict_to_message_convert_value(value)
-        self.fields[key].list_value.CopyFrom(th2_value.list_value)
-
-    elif isinstance(value, (dict, Message)):
-        th2_value = _dict_to_message_convert_value(value)
-        self.fields[key].message_value.CopyFrom(th2_value.message_value)
+    elif isinstance(value, (list, ListValue, dict, Message)):
+        _dict_to_message_check_value(value)
+        _dict_to_message_fill_value(self.fields[key], value)
 
     else:
         raise TypeError(f'Cannot set {type(value)} object as field value: {value}')
 
 
+def message_update(self: Message, fields: Optional[Mapping[str, Any]] = None, **kwargs: Any) -> None:
+    """Sets many fields at once, like dict.update. Nested dicts and lists are written directly to the message.
+
+    All values are checked first, so the message is unchanged if one of them cannot be converted.
+    """
+
+    message_fields = self.fields
+    for field_values in (fields or {}, kwargs):
+        for field_value in field_values.values():
+            _dict_to_message_check_value(field_value)
+    for field_values in (fields or {}, kwargs):
+        for field, field_value in field_values.items():
+            _dict_to_message_fill_value(message_fields[field], field_value)
+
+
+def message_merge(self: Message, fields: Mapping[str, Any]) -> None:
+    """Deeply merges a dict into the message: nested dicts update existing sub-messages field by field
+    instead of replacing them, while simple values and lists are replaced.
+
+    All values are checked first, so the message is unchanged if one of them cannot be converted."""
+
+    for field_value in fields.values():
+        _dict_to_message_check_value(field_value)
+    message_fields = self.fields
+    for field, field_value in fields.items():
+        _dict_to_message_fill_value(message_fields[field], field_value, merge=True)
+
+
 def message_getitem(self: Message, item: str) -> Union[str, List, Dict]:
-    if item in self.fields:
-        value = self.fields[item]
-        return value.__get__(item)  # type: ignore
-    else:
+    value = self.fields.get(item)
+    if value is None:
         raise KeyError(item)
+    return getattr(value, value.WhichOneof('kind'))  # type: ignore
 
 
 def message_contains(self: Message, item: str) -> bool:
@@ -87,10 +104,33 @@ def message_contains(self: Message, item: str) -> bool:
 
 
 def message_repr(self: Message) -> str:
-    return pformat(message_to_dict(self))
+    return render(self)
+
 
+# =========================
+# Activation
+# =========================
 
-setattr(Message, '__setitem__', message_setitem)
-setattr(Message, '__getitem__', message_getitem)
-setattr(Message, '__contains__', message_contains)
-setattr(Message, '__repr__', message_repr)
+_PATCHES = (
+    (Value, '__get__', value_get),
+    (ListValue, '__getitem__', listvalue_getitem),
+    (ListValue, '__len__', listvalue_len),
+    (Message, '__setitem__', message_setitem),
+    (Message, '__getitem__', message_getitem),
+    (Message, '__contains__', message_contains),
+    (Message, '__repr__', message_repr),
+    (Message, 'update', message_update),
+    (Message, 'merge', message_merge)
+)
+
+
+def enable_message_fields_access() -> None:
+    """Adds dict-like access to th2 Message, Value and ListValue classes, e.g. message['Parties']['PartyIDs'][0].
+
+    Also adds `Message.update` and `Message.merge` methods and bounded `Message.__repr__`.
+    The classes are patched only on the first call, next calls do nothing.
+    """
+
+    for cls, attribute, function in _PATCHES:
+        if getattr(cls, attribute, None) is not function:
+            setattr(cls, attribute, function)
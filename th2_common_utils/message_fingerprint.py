@@ -0,0 +1,133 @@
+#   Copyright 2022-2022 Exactpro (Exactpro Systems Limited)
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Callable, Collection, Dict, Iterable, Iterator
+
+from th2_grpc_common.common_pb2 import Direction, Message, MessageMetadata
+
+
+def _format_timestamp(metadata: MessageMetadata) -> str:
+    timestamp = metadata.id.timestamp
+    return f'{timestamp.seconds}.{timestamp.nanos:09}' if metadata.id.HasField('timestamp') else ''
+
+
+def _format_properties(metadata: MessageMetadata) -> str:
+    return ''.join(f'{len(key)}:{key}{len(value)}:{value}' for key, value in sorted(metadata.properties.items()))
+
+
+_METADATA_PARTS: Dict[str, Callable[[MessageMetadata], str]] = {
+    'session_alias': lambda metadata: metadata.id.connection_id.session_alias,
+    'session_group': lambda metadata: metadata.id.connection_id.session_group,
+    'direction': lambda metadata: Direction.Name(metadata.id.direction),
+    'sequence': lambda metadata: str(metadata.id.sequence),
+    'subsequence': lambda metadata: ','.join(map(str, metadata.id.subsequence)),
+    'book_name': lambda metadata: metadata.id.book_name,
+    'timestamp': _format_timestamp,
+    'message_type': lambda metadata: metadata.message_type,
+    'properties': _format_properties,
+    'protocol': lambda metadata: metadata.protocol
+}
+
+# Metadata parts that usually differ between redundant feeds delivering the same message.
+DEFAULT_SKIPPED_METADATA = frozenset({
+    'session_alias', 'session_group', 'sequence', 'subsequence', 'book_name', 'timestamp'
+})
+
+
+def message_fingerprint(message: Message,
+                        skip_metadata: Collection[str] = DEFAULT_SKIPPED_METADATA,
+                        digest_size: int = 16) -> bytes:
+    """Calculates a stable hash of th2-message content.
+
+    The hash doesn't depend on the order of fields in the message: top-level fields are hashed one by one
+    in sorted order and every field value is hashed as its deterministic protobuf encoding (nested maps sorted).
+
+    Args:
+        message: th2-message.
+        skip_metadata: Metadata parts to exclude from the hash (keys of 'metadata' dict of `message_to_dict`).
+        digest_size: Size of the hash in bytes (1 - 64).
+
+    Returns:
+        BLAKE2b hash of the message fields and selected metadata.
+
+    Raises:
+        ValueError: Occurs when 'skip_metadata' contains an unknown metadata part.
+    """
+
+    unknown_parts = set(skip_metadata).difference(_METADATA_PARTS)
+    if unknown_parts:
+        raise ValueError(f'Unknown metadata parts: {sorted(unknown_parts)}')
+
+    message_hash = blake2b(digest_size=digest_size)
+
+    metadata = message.metadata
+    for part_name, get_part in _METADATA_PARTS.items():
+        if part_name not in skip_metadata:
+            part = get_part(metadata)
+            message_hash.update(f'{len(part)}:{part}'.encode())
+
+    for field, field_value in sorted(message.fields.items()):
+        field_bytes = field_value.SerializeToString(deterministic=True)
+        message_hash.update(f'{len(field)}:{field}{len(field_bytes)}:'.encode())
+        message_hash.update(field_bytes)
+
+    return message_hash.digest()
+
+
+class DedupWindow:
+    """Drops duplicates of recently seen messages, remembering fingerprints of the last 'max_size' unique messages.
+
+    Args:
+        max_size: Number of fingerprints to remember. The oldest ones are forgotten first.
+        skip_metadata: Metadata parts to exclude from the comparison (see `message_fingerprint`).
+        digest_size: Size of the fingerprints in bytes.
+    """
+
+    def __init__(self,
+                 max_size: int,
+                 skip_metadata: Collection[str] = DEFAULT_SKIPPED_METADATA,
+                 digest_size: int = 16) -> None:
+        if max_size <= 0:
+            raise ValueError(f'max_size must be positive: {max_size}')
+
+        self.max_size = max_size
+        self.skip_metadata = frozenset(skip_metadata)
+        self.digest_size = digest_size
+        self._fingerprints: 'OrderedDict[bytes, None]' = OrderedDict()
+
+    def is_duplicate(self, message: Message) -> bool:
+        """Checks whether the same message has been seen recently and remembers it otherwise."""
+
+        fingerprint = message_fingerprint(message, self.skip_metadata, self.digest_size)
+        if fingerprint in self._fingerprints:
+            return True
+
+        self._fingerprints[fingerprint] = None
+        if len(self._fingerprints) > self.max_size:
+            self._fingerprints.popitem(last=False)
+        return False
+
+    def drop_duplicates(self, messages: Iterable[Message]) -> Iterator[Message]:
+        """Yields the messages that are not duplicates."""
+
+        is_duplicate = self.is_duplicate
+        return (message for message in messages if not is_duplicate(message))
+
+    def clear(self) -> None:
+        self._fingerprints.clear()
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
@@ -0,0 +1,164 @@
+#   Copyright 2022-2022 Exactpro (Exactpro Systems Limited)
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from th2_grpc_common.common_pb2 import Message, MessageGroupBatch
+
+from th2_common_utils.converters.message_converters import _dict_to_message_fill_value
+from th2_common_utils.field_path import compile_field_path, FieldPath
+from th2_common_utils.wire_format import ANY_MESSAGE_MESSAGE, BATCH_GROUPS, encode_length_delimited, ENTRY_KEY, \
+    ENTRY_VALUE, GROUP_MESSAGES, MESSAGE_FIELDS, VALUE_SIMPLE
+
+Overrides = Mapping[str, Any]
+PathOverride = Tuple[FieldPath, Any]
+
+
+class MessageTemplate:
+    """Produces variants of the base th2-message that differ in a few fields.
+
+    The base message is serialized once. Top-level fields of a variant are set by appending serialized
+    'fields' entries to the base bytes: protobuf replaces map entries with the same key on parsing, so the cost
+    of a variant doesn't depend on the base message size (except for the parsing of the result). Deeper fields
+    (e.g. 'Parties.PartyID') are set by `FieldPath.assign` after parsing, so their sibling fields are kept.
+    Overrides are applied in the mapping order, so top-level fields following a deeper one are also set after
+    parsing (e.g. 'Instrument' replaces the preceding 'Instrument.Symbol', as in `update_fields`).
+
+    Args:
+        base: Base th2-message. Later changes of it don't affect the template.
+    """
+
+    __slots__ = ('base_bytes', '_entry_prefixes', '_paths')
+
+    def __init__(self, base: Message) -> None:
+        self.base_bytes = base.SerializeToString()
+        # Serialized map entry keys by field name (field names are repeated in every variant).
+        self._entry_prefixes: Dict[str, bytes] = {}
+        # Compiled paths and whether they are top-level fields.
+        self._paths: Dict[str, Tuple[FieldPath, bool]] = {}
+
+    def _encode_field(self, field: str, value: Any) -> bytes:
+        if isinstance(value, (str, int, float)):
+            entry_key = self._entry_prefixes.get(field)
+            if entry_key is None:
+                entry_key = self._entry_prefixes[field] = encode_length_delimited(ENTRY_KEY, field.encode())
+            simple_value = encode_length_delimited(VALUE_SIMPLE, str(value).encode())
+            entry = entry_key + encode_length_delimited(ENTRY_VALUE, simple_value)
+            return encode_length_delimited(MESSAGE_FIELDS, entry)
+
+        fragment = Message()
+        _dict_to_message_fill_value(fragment.fields[field], value)
+        return fragment.SerializeToString()
+
+    def _split_overrides(self, overrides: Overrides) -> Tuple[bytes, List[PathOverride]]:
+        """Returns the serialized top-level overrides preceding the first deep one and the rest of overrides."""
+
+        fragments: List[bytes] = []
+        deep_overrides: List[PathOverride] = []
+        paths = self._paths
+
+        for path, value in overrides.items():
+            path_info = paths.get(path)
+            if path_info is None:
+                compiled_path = compile_field_path(path)
+                is_top_level = len(compiled_path.steps) == 1 and compiled_path.steps[0].__class__ is str
+                path_info = paths[path] = (compiled_path, is_top_level)
+
+            field_path, is_top_level = path_info
+            if is_top_level and not deep_overrides:
+                fragments.append(self._encode_field(path, value))
+            else:
+                deep_overrides.append((field_path, value))
+
+        return b''.join(fragments), deep_overrides
+
+    def variant_bytes(self, overrides: Optional[Overrides] = None) -> bytes:
+        """Returns the serialized variant of the base message.
+
+        Args:
+            overrides: Mapping of field paths (e.g. 'ClOrdID', 'Parties.PartyID') to the new values (same types
+                as `dict_to_message` accepts for the fields).
+
+        Returns:
+            Serialized th2-message. If all overrides are top-level fields, it's built without parsing.
+        """
+
+        if not overrides:
+            return self.base_bytes
+
+        fragment, deep_overrides = self._split_overrides(overrides)
+        if not deep_overrides:
+            return self.base_bytes + fragment
+
+        message = Message.FromString(self.base_bytes + fragment)
+        for field_path, value in deep_overrides:
+            field_path.assign(message, value)
+        return message.SerializeToString()
+
+    def variant(self, overrides: Optional[Overrides] = None) -> Message:
+        """Returns the variant of the base message.
+
+        Args:
+            overrides: Mapping of field paths to the new values (see `MessageTemplate.variant_bytes`).
+
+        Returns:
+            New th2-message.
+        """
+
+        if not overrides:
+            return Message.FromString(self.base_bytes)
+
+        fragment, deep_overrides = self._split_overrides(overrides)
+        message = Message.FromString(self.base_bytes + fragment)
+        for field_path, value in deep_overrides:
+            field_path.assign(message, value)
+        return message
+
+    def variants(self, overrides: Iterable[Overrides]) -> Iterator[Message]:
+        """Yields a variant for every mapping of overrides."""
+
+        variant = self.variant
+        return (variant(message_overrides) for message_overrides in overrides)
+
+    def variants_batch(self, overrides: Iterable[Overrides], group_size: int = 1) -> MessageGroupBatch:
+        """Builds MessageGroupBatch of the variants.
+
+        The batch is assembled from the serialized variants and parsed once, without intermediate Message objects.
+
+        Args:
+            overrides: Mappings of overrides, one per variant.
+            group_size: Number of messages per group. The last group can be smaller.
+
+        Returns:
+            MessageGroupBatch with the variants in the order of 'overrides'.
+
+        Raises:
+            ValueError: Occurs when 'group_size' is not positive.
+        """
+
+        if group_size <= 0:
+            raise ValueError(f'group_size must be positive: {group_size}')
+
+        groups: List[bytes] = []
+        group_messages: List[bytes] = []
+        for message_overrides in overrides:
+            any_message = encode_length_delimited(ANY_MESSAGE_MESSAGE, self.variant_bytes(message_overrides))
+            group_messages.append(encode_length_delimited(GROUP_MESSAGES, any_message))
+            if len(group_messages) == group_size:
+                groups.append(encode_length_delimited(BATCH_GROUPS, b''.join(group_messages)))
+                group_messages = []
+        if group_messages:
+            groups.append(encode_length_delimited(BATCH_GROUPS, b''.join(group_messages)))
+
+        return MessageGroupBatch.FromString(b''.join(groups))
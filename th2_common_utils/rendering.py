@@ -0,0 +1,181 @@
+#   Copyright 2022-2022 Exactpro (Exactpro Systems Limited)
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+from typing import Any, Iterable, List, Optional, Tuple
+
+from th2_grpc_common.common_pb2 import ListValue, Message, Value
+
+from th2_common_utils.converters.metadata_converters import message_metadata_to_dict
+
+
+class RenderLimits:
+    """Limits of `render` function output. None means no limit.
+
+    Args:
+        max_depth: Maximum nesting level of dicts, lists and messages. Deeper ones are rendered as '{...}'/'[...]'.
+        max_items: Maximum number of items rendered per dict, list or message.
+        max_chars: Maximum length of the output. The walk stops as soon as it is reached.
+    """
+
+    __slots__ = ('max_depth', 'max_items', 'max_chars')
+
+    def __init__(self,
+                 max_depth: Optional[int] = 16,
+                 max_items: Optional[int] = 1000,
+                 max_chars: Optional[int] = 100_000) -> None:
+        self.max_depth = max_depth
+        self.max_items = max_items
+        self.max_chars = max_chars
+
+
+# Used by `Message.__repr__` and by `render` without limits. Attributes can be changed to tune the limits globally.
+DEFAULT_RENDER_LIMITS = RenderLimits()
+UNLIMITED = RenderLimits(max_depth=None, max_items=None, max_chars=None)
+
+_TRUNCATION_MARK = '...'
+# Only exact types: the representation of subclasses (e.g. OrderedDict, namedtuple) differs from the literals.
+_LITERAL_TYPES = (dict, list, tuple)
+
+
+class _BudgetExhausted(Exception):
+    pass
+
+
+def render(obj: Any, limits: Optional[RenderLimits] = None) -> str:
+    """Renders an object to a string with bounded cost.
+
+    Dicts, lists, tuples and th2 Message/Value/ListValue objects are rendered as Python literals (messages look like
+    the result of `message_to_dict`) without converting them first. Within the limits the result is equal to `str(obj)`
+    for the built-in types. Subclasses of dict, list and tuple (e.g. OrderedDict, namedtuple) are rendered by `str`
+    like other objects.
+
+    Args:
+        obj: Object to render.
+        limits: Output limits. DEFAULT_RENDER_LIMITS are used if not set.
+
+    Returns:
+        String representation of the object. Truncated parts are marked with '...'.
+    """
+
+    limits = limits or DEFAULT_RENDER_LIMITS
+
+    obj_type = type(obj)
+    if obj_type is str:
+        return _truncate(obj, limits.max_chars)
+    if obj_type not in _LITERAL_TYPES and not isinstance(obj, (Message, Value, ListValue)):
+        return _truncate(str(obj), limits.max_chars)
+
+    renderer = _Renderer(limits)
+    try:
+        renderer.render(obj, 0)
+    except _BudgetExhausted:
+        return _truncate(''.join(renderer.parts), limits.max_chars)
+
+    return ''.join(renderer.parts)
+
+
+def _truncate(text: str, max_chars: Optional[int]) -> str:
+    if max_chars is None or len(text) <= max_chars:
+        return text
+    return text[:max(max_chars - len(_TRUNCATION_MARK), 0)] + _TRUNCATION_MARK
+
+
+class _Renderer:
+
+    __slots__ = ('parts', 'remaining', 'max_depth', 'max_items')
+
+    def __init__(self, limits: RenderLimits) -> None:
+        self.parts: List[str] = []
+        self.remaining = limits.max_chars if limits.max_chars is not None else -1
+        self.max_depth = limits.max_depth
+        self.max_items = limits.max_items
+
+    def write(self, text: str) -> None:
+        self.parts.append(text)
+        if self.remaining >= 0:
+            self.remaining -= len(text)
+            if self.remaining < 0:
+                raise _BudgetExhausted
+
+    def render(self, obj: Any, depth: int) -> None:
+        obj_type = type(obj)
+        if isinstance(obj, Value):
+            value_kind = obj.WhichOneof('kind')
+            if value_kind == 'simple_value':
+                self.write(repr(obj.simple_value))
+            elif value_kind == 'message_value':
+                self.render_items('{', '}', obj.message_value.fields.items(), len(obj.message_value.fields), depth)
+            elif value_kind == 'list_value':
+                self.render_sequence('[', ']', obj.list_value.values, depth)
+            else:
+                self.write('None')
+
+        elif obj_type is dict:
+            self.render_items('{', '}', obj.items(), len(obj), depth)
+        elif obj_type is list:
+            self.render_sequence('[', ']', obj, depth)
+        elif obj_type is tuple:
+            self.render_sequence('(', ',)' if len(obj) == 1 else ')', obj, depth)
+
+        elif isinstance(obj, ListValue):
+            self.render_sequence('[', ']', obj.values, depth)
+        elif isinstance(obj, Message):
+            self.render_message(obj, depth)
+        elif obj_type is str:
+            self.write(repr(obj) if self.remaining < 0 or len(obj) <= self.remaining else repr(obj[:self.remaining]))
+        else:
+            self.write(repr(obj))
+
+    def render_message(self, message: Message, depth: int) -> None:
+        if self.max_depth is not None and depth >= self.max_depth:
+            self.write(f'{{{_TRUNCATION_MARK}}}')
+            return
+
+        self.write(f"{{'parent_event_id': {message.parent_event_id.id!r}, 'metadata': ")
+        self.render(message_metadata_to_dict(message.metadata), depth + 1)
+        self.write(", 'fields': ")
+        self.render_items('{', '}', message.fields.items(), len(message.fields), depth + 1)
+        self.write('}')
+
+    def render_items(self, opening: str, closing: str, items: Iterable[Tuple[Any, Any]], size: int,
+                     depth: int) -> None:
+        if self.max_depth is not None and depth >= self.max_depth:
+            self.write(f'{opening}{_TRUNCATION_MARK}{closing}')
+            return
+
+        self.write(opening)
+        for index, (key, value) in enumerate(items):
+            if index:
+                self.write(', ')
+            if self.max_items is not None and index >= self.max_items:
+                self.write(f'{_TRUNCATION_MARK}({size - index} more)')
+                break
+            self.write(f'{key!r}: ')
+            self.render(value, depth + 1)
+        self.write(closing)
+
+    def render_sequence(self, opening: str, closing: str, values: Any, depth: int) -> None:
+        if self.max_depth is not None and depth >= self.max_depth:
+            self.write(f'{opening}{_TRUNCATION_MARK}{closing}')
+            return
+
+        self.write(opening)
+        for index, value in enumerate(values):
+            if index:
+                self.write(', ')
+            if self.max_items is not None and index >= self.max_items:
+                self.write(f'{_TRUNCATION_MARK}({len(values) - index} more)')
+                break
+            self.render(value, depth + 1)
+        self.write(closing)
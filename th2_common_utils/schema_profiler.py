@@ -0,0 +1,229 @@
+#   Copyright 2022-2022 Exactpro (Exactpro Systems Limited)
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""Streaming inference of the field paths and value shapes of th2-messages.
+
+Paths of list elements use '[*]' instead of the index, e.g. 'Parties.PartyIDs[*].PartyID'.
+Profilers can be pickled, so streams can be profiled in several processes and the results merged.
+"""
+
+from hashlib import blake2b
+import math
+from typing import Any, Dict, Iterable
+
+from th2_grpc_common.common_pb2 import Message
+
+
+VALUE_KINDS = ('simple', 'list', 'message', 'null')
+
+_KIND_INDEXES = {'simple_value': 0, 'list_value': 1, 'message_value': 2, 'null_value': 3}
+
+
+class _CardinalitySketch:
+    """HyperLogLog estimate of the number of distinct strings.
+
+    Strings are hashed with BLAKE2b (not `hash()`, which is randomized per process), so sketches of different
+    processes can be merged.
+    """
+
+    __slots__ = ('precision', 'registers')
+
+    def __init__(self, precision: int) -> None:
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add(self, value: str) -> None:
+        hash_value = int.from_bytes(blake2b(value.encode(), digest_size=8).digest(), 'little')
+        index = hash_value & ((1 << self.precision) - 1)
+        rank = (64 - self.precision) - (hash_value >> self.precision).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other: '_CardinalitySketch') -> None:
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def estimate(self) -> int:
+        size = len(self.registers)
+        raw_estimate = 0.7213 / (1 + 1.079 / size) * size * size / sum(2.0 ** -rank for rank in self.registers)
+        empty_registers = self.registers.count(0)
+        if raw_estimate <= 2.5 * size and empty_registers:
+            return round(size * math.log(size / empty_registers))  # linear counting for small cardinalities
+        return round(raw_estimate)
+
+
+class FieldProfile:
+    """Statistics of one field path.
+
+    Attributes:
+        kind_counts: Number of values of every kind (see VALUE_KINDS), in the same order as VALUE_KINDS.
+        max_list_length: Maximum length of the list values.
+    """
+
+    __slots__ = ('kind_counts', 'max_list_length', '_sketch')
+
+    def __init__(self, precision: int) -> None:
+        self.kind_counts = [0, 0, 0, 0]
+        self.max_list_length = 0
+        self._sketch = _CardinalitySketch(precision)
+
+    @property
+    def count(self) -> int:
+        """Number of values."""
+
+        return sum(self.kind_counts)
+
+    @property
+    def kinds(self) -> Dict[str, int]:
+        """Number of values by kind, only the kinds that occurred."""
+
+        return {kind: count for kind, count in zip(VALUE_KINDS, self.kind_counts) if count}
+
+    def cardinality(self) -> int:
+        """Estimated number of distinct simple values (the error is about 1.04 / sqrt(2 ** precision))."""
+
+        return self._sketch.estimate()
+
+    def merge(self, other: 'FieldProfile') -> None:
+        self.kind_counts = [count + other_count for count, other_count in zip(self.kind_counts, other.kind_counts)]
+        self.max_list_length = max(self.max_list_length, other.max_list_length)
+        self._sketch.merge(other._sketch)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'kinds': self.kinds,
+            'cardinality': self.cardinality(),
+            'max_list_length': self.max_list_length
+        }
+
+
+class SchemaProfiler:
+    """Collects the field paths of th2-messages and statistics of their values per message type.
+
+    Memory doesn't depend on the number of messages: every path keeps a fixed-size cardinality sketch,
+    and at most 'max_paths' paths are tracked per message type (values of other paths are counted in
+    'dropped_values').
+
+    Args:
+        max_paths: Maximum number of paths per message type.
+        precision: Precision of the cardinality estimates; every path takes 2 ** precision bytes.
+
+    Attributes:
+        message_counts: Number of profiled messages by message type.
+        profiles: Field profiles by message type and field path.
+        dropped_values: Number of values of the paths that were not tracked due to 'max_paths'.
+    """
+
+    def __init__(self, max_paths: int = 1000, precision: int = 10) -> None:
+        if not 4 <= precision <= 16:
+            raise ValueError(f'precision must be in [4, 16]: {precision}')
+
+        self.max_paths = max_paths
+        self.precision = precision
+        self.message_counts: Dict[str, int] = {}
+        self.profiles: Dict[str, Dict[str, FieldProfile]] = {}
+        self.dropped_values = 0
+
+    def _get_profile(self, profiles: Dict[str, FieldProfile], path: str) -> Any:
+        profile = profiles.get(path)
+        if profile is None:
+            if len(profiles) >= self.max_paths:
+                self.dropped_values += 1
+                return None
+            profile = FieldProfile(self.precision)
+            profiles[path] = profile
+        return profile
+
+    def _add_value(self, profiles: Dict[str, FieldProfile], path: str, value: Any) -> None:
+        kind = value.WhichOneof('kind')
+        if kind is None:
+            raise TypeError(f'Expected simple_value, list_value, message_value or null_value. '
+                            f'Empty value received in {path}')
+
+        profile = profiles.get(path) or self._get_profile(profiles, path)
+        if profile is not None:
+            profile.kind_counts[_KIND_INDEXES[kind]] += 1
+
+        if kind == 'simple_value':
+            if profile is not None:
+                profile._sketch.add(value.simple_value)
+        elif kind == 'message_value':
+            self._add_fields(profiles, path + '.', value.message_value.fields)
+        elif kind == 'list_value':
+            values = value.list_value.values
+            if profile is not None and len(values) > profile.max_list_length:
+                profile.max_list_length = len(values)
+            item_path = path + '[*]'
+            for item in values:
+                self._add_value(profiles, item_path, item)
+
+    def _add_fields(self, profiles: Dict[str, FieldProfile], prefix: str, fields: Any) -> None:
+        add_value = self._add_value
+        for field, value in fields.items():
+            add_value(profiles, prefix + field, value)
+
+    def add(self, message: Message) -> None:
+        """Profiles the message.
+
+        Raises:
+            TypeError: Occurs when the message contains an empty Value.
+        """
+
+        message_type = message.metadata.message_type
+        self.message_counts[message_type] = self.message_counts.get(message_type, 0) + 1
+        profiles = self.profiles.get(message_type)
+        if profiles is None:
+            profiles = self.profiles[message_type] = {}
+        self._add_fields(profiles, '', message.fields)
+
+    def add_many(self, messages: Iterable[Message]) -> None:
+        add = self.add
+        for message in messages:
+            add(message)
+
+    def merge(self, other: 'SchemaProfiler') -> None:
+        """Adds the statistics of another profiler (e.g. of another process) to this one.
+
+        Raises:
+            ValueError: Occurs when the profilers have different precision.
+        """
+
+        if other.precision != self.precision:
+            raise ValueError(f'Cannot merge profilers with different precision: {self.precision}, {other.precision}')
+
+        for message_type, count in other.message_counts.items():
+            self.message_counts[message_type] = self.message_counts.get(message_type, 0) + count
+        self.dropped_values += other.dropped_values
+
+        for message_type, other_profiles in other.profiles.items():
+            profiles = self.profiles.setdefault(message_type, {})
+            for path, other_profile in other_profiles.items():
+                profile = profiles.get(path)
+                if profile is None:
+                    if len(profiles) >= self.max_paths:
+                        self.dropped_values += other_profile.count
+                        continue
+                    profile = profiles[path] = FieldProfile(self.precision)
+                profile.merge(other_profile)
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Returns the statistics as {message type: {'count': ..., 'fields': {path: statistics}}}."""
+
+        return {
+            message_type: {
+                'count': self.message_counts[message_type],
+                'fields': {path: profile.to_dict() for path, profile in profiles.items()}
+            }
+            for message_type, profiles in self.profiles.items()
+        }
@@ -0,0 +1,114 @@
+#   Copyright 2022-2022 Exactpro (Exactpro Systems Limited)
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+"""Reading and writing of the protobuf wire format of the th2 schema without protobuf objects.
+
+Positions are offsets in the buffer; readers return the new position along with the value.
+"""
+
+from typing import Tuple, Union
+
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+# Wire types.
+VARINT = 0
+I64 = 1
+LEN = 2
+I32 = 5
+
+# Tags (field number << 3 | wire type) of the th2 schema fields.
+MESSAGE_FIELDS = 0x12
+ENTRY_KEY = 0x0a
+ENTRY_VALUE = 0x12
+VALUE_SIMPLE = 0x12
+BATCH_GROUPS = 0x0a
+GROUP_MESSAGES = 0x0a
+ANY_MESSAGE_MESSAGE = 0x0a
+ANY_MESSAGE_RAW_MESSAGE = 0x12
+RAW_MESSAGE_METADATA = 0x0a
+RAW_MESSAGE_BODY = 0x12
+RAW_MESSAGE_PARENT_EVENT_ID = 0x1a
+
+
+class WireFormatError(ValueError):
+    """Raised when the input is not a valid serialized th2 message."""
+
+
+def read_varint(buffer: Buffer, position: int) -> Tuple[int, int]:
+    result = 0
+    shift = 0
+    try:
+        while True:
+            byte = buffer[position]
+            position += 1
+            result |= (byte & 0x7f) << shift
+            if byte < 0x80:
+                return result, position
+            shift += 7
+    except IndexError:
+        raise WireFormatError('Truncated varint') from None
+
+
+def read_length(buffer: Buffer, position: int, end: int) -> Tuple[int, int]:
+    """Reads a length prefix and returns (start, end) of the length-delimited part."""
+
+    length = buffer[position] if position < end else 0x80
+    if length < 0x80:
+        position += 1
+    else:
+        length, position = read_varint(buffer, position)
+
+    part_end = position + length
+    if part_end > end:
+        raise WireFormatError('Length-delimited field exceeds its parent')
+    return position, part_end
+
+
+def read_tag(buffer: Buffer, position: int) -> Tuple[int, int]:
+    tag = buffer[position]
+    if tag < 0x80:
+        return tag, position + 1
+    return read_varint(buffer, position)
+
+
+def skip_field(buffer: Buffer, tag: int, position: int, end: int) -> int:
+    """Returns the position after the value of the field with the tag."""
+
+    wire_type = tag & 7
+    if wire_type == VARINT:
+        return read_varint(buffer, position)[1]
+    elif wire_type == LEN:
+        return read_length(buffer, position, end)[1]
+    elif wire_type in (I64, I32):
+        position += 8 if wire_type == I64 else 4
+        if position > end:
+            raise WireFormatError('Fixed-size field exceeds its parent')
+        return position
+    else:
+        raise WireFormatError(f'Unsupported wire type {wire_type}')
+
+
+def encode_varint(value: int) -> bytes:
+    encoded = bytearray()
+    while value > 0x7f:
+        encoded.append(value & 0x7f | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def encode_length_delimited(tag: int, data: bytes) -> bytes:
+    return bytes((tag,)) + encode_varint(len(data)) + data